@@ -2,43 +2,278 @@
 Python client examples for LightRAG MCP HTTP Server.
 """
 
-import requests
+import asyncio
+import importlib.util
+import io
 import json
-from typing import Iterator, Dict, Any
+import math
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, Dict, Any, List, Optional, Sequence, TextIO, Tuple
+
+import httpx
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, streaming falls back to line splitting
+    ijson = None
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# JSON codec shared by the client: bytes in, bytes out
+_dumps = orjson.dumps if orjson else (lambda obj: json.dumps(obj).encode("utf-8"))
+_loads = orjson.loads if orjson else json.loads
+
+
+def _decode(response: Any) -> Any:
+    """Parse a buffered JSON response body straight from its bytes.
+
+    Skips the str decode and stdlib parser behind ``response.json()``;
+    works for both requests and httpx responses.
+    """
+    return _loads(response.content)
+
+
+def _insert_texts_body(texts: list) -> bytes:
+    """Return the encoded insert_texts request body.
+
+    The static example document set is encoded once at import; any other
+    list is encoded fresh on every call.
+    """
+    if texts is _EXAMPLE_DOCS:
+        return _EXAMPLE_DOCS_JSON
+    return _dumps({"arguments": {"texts": texts}})
+
+
+def _batches(items: list, batch_size: int) -> List[list]:
+    """Split a list into consecutive slices of at most batch_size items."""
+    return [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+
+
+def _merge_insert_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine per-batch insert_texts results into one summary."""
+    return {
+        "batches": len(results),
+        "track_ids": [r.get("track_id") for r in results if r.get("track_id")],
+        "results": results,
+    }
+
+
+class _QueryCache:
+    """LRU + TTL cache for query_text answers, keyed by (mode, query).
+
+    When an ``embedding_fn`` is given, a miss on the exact key falls back to
+    the cached query of the same mode whose embedding is most similar
+    (cosine), provided it clears ``similarity_threshold``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 300.0,
+        embedding_fn: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.95,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.embedding_fn = embedding_fn
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+        self._vecs: Dict[Tuple[str, str], Sequence[float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _live(self, key: Tuple[str, str]) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        self._vecs.pop(key, None)
+
+    def _nearest(self, mode: str, vec: Sequence[float]) -> Optional[Tuple[str, str]]:
+        keys = [k for k in self._vecs if k[0] == mode]
+        if not keys:
+            return None
+        try:
+            import numpy as np
+        except ImportError:  # small caches are fine in pure Python
+            def cos(a, b):
+                dot = sum(x * y for x, y in zip(a, b))
+                norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+                return dot / norm if norm else 0.0
+            scores = [cos(vec, self._vecs[k]) for k in keys]
+        else:
+            matrix = np.asarray([self._vecs[k] for k in keys], dtype=float)
+            target = np.asarray(vec, dtype=float)
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(target)
+            scores = (matrix @ target / np.where(norms == 0, 1, norms)).tolist()
+        best = max(range(len(keys)), key=scores.__getitem__)
+        return keys[best] if scores[best] >= self.similarity_threshold else None
+
+    def get(self, mode: str, query: str) -> Tuple[Optional[str], Optional[Sequence[float]]]:
+        """Look up an answer; also return the query embedding (if computed)."""
+        value = self._live((mode, query))
+        vec = None
+        if value is None and self.embedding_fn is not None:
+            vec = self.embedding_fn(query)
+            near = self._nearest(mode, vec)
+            if near is not None:
+                value = self._live(near)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value, vec
+
+    def put(self, mode: str, query: str, value: str, vec: Optional[Sequence[float]] = None) -> None:
+        key = (mode, query)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if self.embedding_fn is not None:
+            self._vecs[key] = vec if vec is not None else self.embedding_fn(query)
+        while len(self._entries) > self.maxsize:
+            self._drop(next(iter(self._entries)))
+
+    def invalidate(self) -> None:
+        """Drop all entries but keep the hit/miss counters."""
+        self._entries.clear()
+        self._vecs.clear()
+
+    def clear(self) -> None:
+        self.invalidate()
+        self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
 
 
 class LightRAGHTTPClient:
     """Simple HTTP client for LightRAG MCP Server."""
 
-    def __init__(self, base_url: str = "http://localhost:8000", prefix: str = "default"):
+    __slots__ = (
+        "base_url",
+        "prefix",
+        "_prefix_marker",
+        "_base_mcp",
+        "_url_cache",
+        "_session",
+        "_get",
+        "_post",
+        "_query_cache",
+    )
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        prefix: str = "default",
+        cache_size: int = 256,
+        cache_ttl: float = 300.0,
+        embedding_fn: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.95,
+    ):
         """
         Initialize the client.
 
         Args:
             base_url: Base URL of the HTTP server
             prefix: Tool prefix to use
+            cache_size: Maximum number of cached query_text answers
+            cache_ttl: Seconds a cached answer stays valid
+            embedding_fn: Optional text -> vector function enabling
+                similarity lookups in the query cache
+            similarity_threshold: Minimum cosine similarity for a cache hit
+                when embedding_fn is set
         """
         self.base_url = base_url.rstrip("/")
         self.prefix = prefix
+        self._query_cache = _QueryCache(cache_size, cache_ttl, embedding_fn, similarity_threshold)
+
+        # Pieces of the tool URL that are fixed for this client
+        self._prefix_marker = f"{prefix}_"
+        self._base_mcp = f"{self.base_url}/mcp/{prefix}"
+        self._url_cache: Dict[str, str] = {}
+
+        # Reuse one pooled, keep-alive session for every call. Transient
+        # gateway errors on idempotent GETs are retried on the pooled
+        # connection; POSTs are never retried so inserts are not repeated.
+        self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "Connection": "keep-alive",
+            "Content-Type": "application/json",
+        })
+
+        # Pre-bound session methods for the hot paths
+        self._get = self._session.get
+        self._post = self._session.post
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> "LightRAGHTTPClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def _tool_url(self, tool_name: str) -> str:
         """Get full URL for a tool."""
+        if (url := self._url_cache.get(tool_name)) is not None:
+            return url
+
         # Tool name should already include prefix
-        if not tool_name.startswith(f"{self.prefix}_"):
-            tool_name = f"{self.prefix}_{tool_name}"
-        return f"{self.base_url}/mcp/{self.prefix}/{tool_name}"
+        full_name = tool_name
+        if not full_name.startswith(self._prefix_marker):
+            full_name = self._prefix_marker + full_name
+        url = f"{self._base_mcp}/{full_name}"
+        self._url_cache[tool_name] = url
+        return url
 
     def health(self) -> Dict[str, Any]:
         """Check server health."""
-        response = requests.get(f"{self.base_url}/health")
+        response = self._get(f"{self.base_url}/health")
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
 
     def list_tools(self) -> Dict[str, Any]:
         """List all tools for this prefix."""
-        response = requests.get(f"{self.base_url}/mcp/{self.prefix}/tools")
+        response = self._get(f"{self.base_url}/mcp/{self.prefix}/tools")
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
 
     def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -52,12 +287,10 @@ class LightRAGHTTPClient:
             Tool execution result
         """
         url = self._tool_url(tool_name)
-        response = requests.post(
-            url,
-            json={"arguments": arguments}
-        )
+        body = _dumps({"arguments": arguments})
+        response = self._post(url, data=body)
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
 
     def execute_tool_stream(self, tool_name: str, arguments: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
@@ -71,23 +304,42 @@ class LightRAGHTTPClient:
             Streaming chunks as dictionaries
         """
         url = self._tool_url(tool_name)
-        response = requests.post(
-            url,
-            json={"arguments": arguments, "stream": True},
-            stream=True
-        )
+        body = _dumps({"arguments": arguments, "stream": True})
+        response = self._post(url, data=body, stream=True)
         response.raise_for_status()
 
-        for line in response.iter_lines():
-            if line:
-                yield json.loads(line.decode("utf-8"))
+        # Split NDJSON straight off the socket buffer instead of iter_lines()
+        buf = bytearray()
+        for chunk in response.raw.stream(65536, decode_content=True):
+            buf += chunk
+            while (idx := buf.find(b"\n")) != -1:
+                line = bytes(buf[:idx])
+                del buf[:idx + 1]
+                if line.strip():
+                    yield _loads(line)
+
+        if buf.strip():
+            yield _loads(bytes(buf))
 
     # Convenient methods for common tools
 
     def query_text(self, query: str, mode: str = "hybrid") -> str:
-        """Query with text."""
+        """Query with text, answering repeated queries from the local cache."""
+        cached, vec = self._query_cache.get(mode, query)
+        if cached is not None:
+            return cached
         result = self.execute_tool("query_text", {"query": query, "mode": mode})
-        return result["data"]["response"]
+        answer = result["data"]["response"]
+        self._query_cache.put(mode, query, answer, vec)
+        return answer
+
+    def clear_cache(self) -> None:
+        """Drop all cached query_text answers."""
+        self._query_cache.clear()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters of the query cache."""
+        return self._query_cache.stats()
 
     def query_text_stream(self, query: str, mode: str = "hybrid") -> Iterator[str]:
         """Query with streaming response."""
@@ -100,161 +352,395 @@ class LightRAGHTTPClient:
     def insert_text(self, text: str) -> Dict[str, Any]:
         """Insert text content."""
         result = self.execute_tool("insert_text", {"text": text})
+        # New content can change any cached answer
+        self._query_cache.invalidate()
         return result["data"]
 
     def insert_texts(self, texts: list) -> Dict[str, Any]:
         """Insert multiple text documents."""
-        result = self.execute_tool("insert_texts", {"texts": texts})
-        return result["data"]
+        response = self._post(
+            self._tool_url("insert_texts"),
+            data=_insert_texts_body(texts)
+        )
+        response.raise_for_status()
+        self._query_cache.invalidate()
+        return _decode(response)["data"]
+
+    def insert_texts_batched(self, texts: list, batch_size: int = 64, max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Insert a large list of documents in concurrent batches.
+
+        Each batch is serialized once and sent as its own insert_texts call
+        over the session's connection pool.
+
+        Args:
+            texts: Documents to insert
+            batch_size: Maximum documents per request
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            Summary with the number of batches and the collected track_ids
+        """
+        batches = _batches(texts, batch_size)
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches) or 1)) as pool:
+                # Batches are throwaway lists, so skip the body cache
+                results = list(pool.map(
+                    lambda batch: self.execute_tool("insert_texts", {"texts": batch})["data"],
+                    batches
+                ))
+        finally:
+            # Some batches may have landed even if another one failed
+            self._query_cache.invalidate()
+        return _merge_insert_results(results)
 
     def get_documents(self, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
         """Get documents with pagination."""
         result = self.execute_tool("get_documents_paginated", {"page": page, "page_size": page_size})
         return result["data"]
 
-    def get_knowledge_graph(self) -> Dict[str, Any]:
-        """Get knowledge graph."""
-        result = self.execute_tool("get_knowledge_graph", {})
+    def get_knowledge_graph(self, label: str = "*", max_nodes: Optional[int] = None, max_depth: Optional[int] = None) -> Dict[str, Any]:
+        """Get knowledge graph, optionally capped to max_nodes / max_depth."""
+        arguments: Dict[str, Any] = {"label": label}
+        if max_nodes is not None:
+            arguments["max_nodes"] = max_nodes
+        if max_depth is not None:
+            arguments["max_depth"] = max_depth
+        result = self.execute_tool("get_knowledge_graph", arguments)
         return result["data"]
 
 
-def example_basic_usage():
+class _AsyncByteReader:
+    """Minimal async file-like adapter over an async byte iterator (for ijson)."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs. str; don't consume
+        if size == 0:
+            return b""
+        # Otherwise it only needs "some bytes, or b'' at EOF"; size is advisory
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+class AsyncLightRAGHTTPClient:
+    """Async HTTP client for LightRAG MCP Server.
+
+    Keeps a single ``httpx.AsyncClient`` so independent calls can be issued
+    concurrently with ``asyncio.gather`` over one multiplexed connection.
+    HTTP/2 is used when the ``h2`` package is installed
+    (``pip install httpx[http2]``); otherwise it falls back to HTTP/1.1.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000", prefix: str = "default"):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: Base URL of the HTTP server
+            prefix: Tool prefix to use
+        """
+        self.base_url = base_url.rstrip("/")
+        self.prefix = prefix
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncLightRAGHTTPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    def _tool_path(self, tool_name: str) -> str:
+        """Get the URL path for a tool."""
+        if not tool_name.startswith(f"{self.prefix}_"):
+            tool_name = f"{self.prefix}_{tool_name}"
+        return f"/mcp/{self.prefix}/{tool_name}"
+
+    async def health(self) -> Dict[str, Any]:
+        """Check server health."""
+        response = await self._client.get("/health")
+        response.raise_for_status()
+        return _decode(response)
+
+    async def list_tools(self) -> Dict[str, Any]:
+        """List all tools for this prefix."""
+        response = await self._client.get(f"/mcp/{self.prefix}/tools")
+        response.raise_for_status()
+        return _decode(response)
+
+    async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a tool and return the result."""
+        response = await self._client.post(
+            self._tool_path(tool_name),
+            json={"arguments": arguments}
+        )
+        response.raise_for_status()
+        return _decode(response)
+
+    async def execute_tool_stream(self, tool_name: str, arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a tool with streaming response.
+
+        With ijson installed, JSON values are parsed incrementally from the
+        byte stream and yielded as soon as each one is complete, whatever the
+        whitespace between them. Without it, the stream is split on newlines.
+
+        Args:
+            tool_name: Tool name
+            arguments: Tool arguments
+
+        Yields:
+            Streaming chunks as dictionaries
+        """
+        body = _dumps({"arguments": arguments, "stream": True})
+        async with self._client.stream(
+            "POST",
+            self._tool_path(tool_name),
+            content=body,
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            response.raise_for_status()
+            chunks = response.aiter_bytes(65536)
+
+            if ijson is not None:
+                async for item in ijson.items_async(_AsyncByteReader(chunks), "", multiple_values=True):
+                    yield item
+                return
+
+            buf = bytearray()
+            async for chunk in chunks:
+                buf += chunk
+                while (idx := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:idx])
+                    del buf[:idx + 1]
+                    if line.strip():
+                        yield _loads(line)
+            if buf.strip():
+                yield _loads(bytes(buf))
+
+    # Convenient methods for common tools
+
+    async def query_text(self, query: str, mode: str = "hybrid") -> str:
+        """Query with text."""
+        result = await self.execute_tool("query_text", {"query": query, "mode": mode})
+        return result["data"]["response"]
+
+    async def query_text_stream(self, query: str, mode: str = "hybrid") -> AsyncIterator[str]:
+        """Query with streaming response."""
+        async for chunk in self.execute_tool_stream("query_text_stream", {"query": query, "mode": mode}):
+            if chunk["type"] == "chunk":
+                yield chunk["data"]
+            elif chunk["type"] == "error":
+                raise Exception(chunk["error"])
+
+    async def insert_text(self, text: str) -> Dict[str, Any]:
+        """Insert text content."""
+        result = await self.execute_tool("insert_text", {"text": text})
+        return result["data"]
+
+    async def insert_texts(self, texts: list) -> Dict[str, Any]:
+        """Insert multiple text documents."""
+        response = await self._client.post(
+            self._tool_path("insert_texts"),
+            content=_insert_texts_body(texts),
+            headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+        return _decode(response)["data"]
+
+    async def insert_texts_batched(self, texts: list, batch_size: int = 64) -> Dict[str, Any]:
+        """Insert a large list of documents as concurrent batched requests."""
+        results = await asyncio.gather(
+            *(self.execute_tool("insert_texts", {"texts": batch})
+              for batch in _batches(texts, batch_size))
+        )
+        return _merge_insert_results([r["data"] for r in results])
+
+    async def get_documents(self, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+        """Get documents with pagination."""
+        result = await self.execute_tool("get_documents_paginated", {"page": page, "page_size": page_size})
+        return result["data"]
+
+    async def get_knowledge_graph(self, label: str = "*", max_nodes: Optional[int] = None, max_depth: Optional[int] = None) -> Dict[str, Any]:
+        """Get knowledge graph, optionally capped to max_nodes / max_depth."""
+        arguments: Dict[str, Any] = {"label": label}
+        if max_nodes is not None:
+            arguments["max_nodes"] = max_nodes
+        if max_depth is not None:
+            arguments["max_depth"] = max_depth
+        result = await self.execute_tool("get_knowledge_graph", arguments)
+        return result["data"]
+
+
+# Static document set for the document management example; its request body
+# is encoded once and reused by insert_texts on re-runs.
+_EXAMPLE_DOCS = [
+    {
+        "title": "Chapter 21",
+        "content": "The hero faces their greatest challenge...",
+        "metadata": {"chapter": 21}
+    },
+    {
+        "title": "Chapter 22",
+        "content": "Victory comes at a great cost...",
+        "metadata": {"chapter": 22}
+    }
+]
+_EXAMPLE_DOCS_JSON = _dumps({"arguments": {"texts": _EXAMPLE_DOCS}})
+
+
+async def example_basic_usage():
     """Basic usage example."""
     print("=" * 70)
     print("Example 1: Basic Usage")
     print("=" * 70)
 
-    client = LightRAGHTTPClient(prefix="novel_style")
+    async with AsyncLightRAGHTTPClient(prefix="novel_style") as client:
+        # Health check and tool listing are independent, run them together
+        health, tools_info = await asyncio.gather(client.health(), client.list_tools())
+        print(f"Server status: {health['status']}")
+        print(f"Available prefixes: {health['prefixes']}\n")
 
-    # Health check
-    health = client.health()
-    print(f"Server status: {health['status']}")
-    print(f"Available prefixes: {health['prefixes']}\n")
+        print(f"Tools for prefix '{client.prefix}': {tools_info['count']}")
+        print(f"First tool: {tools_info['tools'][0]['name']}\n")
 
-    # List tools
-    tools_info = client.list_tools()
-    print(f"Tools for prefix '{client.prefix}': {tools_info['count']}")
-    print(f"First tool: {tools_info['tools'][0]['name']}\n")
+        # Query
+        response = await client.query_text("What writing techniques are used?")
+        print(f"Query response: {response[:100]}...\n")
 
-    # Query
-    response = client.query_text("What writing techniques are used?")
-    print(f"Query response: {response[:100]}...\n")
 
-
-def example_streaming():
+def example_streaming(out: Optional[TextIO] = None):
     """Streaming query example."""
-    print("=" * 70)
-    print("Example 2: Streaming Query")
-    print("=" * 70)
-
-    client = LightRAGHTTPClient(prefix="novel_content")
+    out = out or sys.stdout
+    print("=" * 70, file=out)
+    print("Example 2: Streaming Query", file=out)
+    print("=" * 70, file=out)
 
-    print("Streaming query: ", end="", flush=True)
-    for chunk in client.query_text_stream("Summarize the main plot"):
-        print(chunk, end="", flush=True)
-    print("\n")
+    with LightRAGHTTPClient(prefix="novel_content") as client:
+        print("Streaming query: ", end="", flush=True, file=out)
+        for chunk in client.query_text_stream("Summarize the main plot"):
+            print(chunk, end="", flush=True, file=out)
+        print("\n", file=out)
 
 
-def example_document_management():
+async def example_document_management():
     """Document management example."""
     print("=" * 70)
     print("Example 3: Document Management")
     print("=" * 70)
 
-    client = LightRAGHTTPClient(prefix="novel_content")
-
-    # Insert single document
-    result = client.insert_text("Chapter 20: The final confrontation begins...")
-    print(f"Inserted document, track_id: {result.get('track_id', 'N/A')}")
-
-    # Insert multiple documents
-    docs = [
-        {
-            "title": "Chapter 21",
-            "content": "The hero faces their greatest challenge...",
-            "metadata": {"chapter": 21}
-        },
-        {
-            "title": "Chapter 22",
-            "content": "Victory comes at a great cost...",
-            "metadata": {"chapter": 22}
-        }
-    ]
-    result = client.insert_texts(docs)
-    print(f"Inserted {len(docs)} documents")
-
-    # Get documents
-    docs_page = client.get_documents(page=1, page_size=10)
-    print(f"Total documents: {docs_page.get('total', 'N/A')}")
-    print(f"Current page: {docs_page.get('page', 'N/A')}\n")
+    docs = _EXAMPLE_DOCS
+    batch_size = 64
+
+    async with AsyncLightRAGHTTPClient(prefix="novel_content") as client:
+        # Large inputs are split into batches; small ones go out as one request
+        if len(docs) > batch_size:
+            insert_docs = client.insert_texts_batched(docs, batch_size=batch_size)
+        else:
+            insert_docs = client.insert_texts(docs)
+
+        # Inserts and the document listing don't depend on each other
+        result, _, docs_page = await asyncio.gather(
+            client.insert_text("Chapter 20: The final confrontation begins..."),
+            insert_docs,
+            client.get_documents(page=1, page_size=10),
+        )
+        print(f"Inserted document, track_id: {result.get('track_id', 'N/A')}")
+        print(f"Inserted {len(docs)} documents")
+        print(f"Total documents: {docs_page.get('total', 'N/A')}")
+        print(f"Current page: {docs_page.get('page', 'N/A')}\n")
 
 
-def example_knowledge_graph():
+async def example_knowledge_graph():
     """Knowledge graph example."""
     print("=" * 70)
     print("Example 4: Knowledge Graph")
     print("=" * 70)
 
-    client = LightRAGHTTPClient(prefix="novel_style")
-
-    # Get knowledge graph
-    graph = client.get_knowledge_graph()
-    nodes = graph.get("nodes", [])
-    edges = graph.get("edges", [])
+    async with AsyncLightRAGHTTPClient(prefix="novel_style") as client:
+        # Only a preview is printed, so cap the subgraph the server returns
+        # instead of downloading the whole graph
+        graph = await client.get_knowledge_graph(max_nodes=10, max_depth=1)
+        nodes = graph.get("nodes", [])
+        edges = graph.get("edges", [])
 
-    print(f"Knowledge graph:")
-    print(f"  Nodes: {len(nodes)}")
-    print(f"  Edges: {len(edges)}")
+        print("Knowledge graph preview:")
+        print(f"  Nodes: {len(nodes)}")
+        print(f"  Edges: {len(edges)}")
+        print(f"  Truncated: {graph.get('is_truncated', False)}")
 
-    if nodes:
-        print(f"\nFirst node: {nodes[0]}")
+        if nodes:
+            print(f"\nFirst node: {nodes[0]}")
 
-    if edges:
-        print(f"First edge: {edges[0]}\n")
+        if edges:
+            print(f"First edge: {edges[0]}\n")
 
 
-def example_error_handling():
+def example_error_handling(out: Optional[TextIO] = None):
     """Error handling example."""
-    print("=" * 70)
-    print("Example 5: Error Handling")
-    print("=" * 70)
+    out = out or sys.stdout
+    print("=" * 70, file=out)
+    print("Example 5: Error Handling", file=out)
+    print("=" * 70, file=out)
 
-    client = LightRAGHTTPClient(prefix="novel_style")
+    with LightRAGHTTPClient(prefix="novel_style") as client:
+        try:
+            # This will fail - wrong tool name
+            client.execute_tool("nonexistent_tool", {})
+        except requests.HTTPError as e:
+            print(f"HTTP Error: {e}", file=out)
+            print(f"Response: {e.response.json()}\n", file=out)
 
-    try:
-        # This will fail - wrong tool name
-        client.execute_tool("nonexistent_tool", {})
-    except requests.HTTPError as e:
-        print(f"HTTP Error: {e}")
-        print(f"Response: {e.response.json()}\n")
+        # Failed calls never populate the query cache
+        print(f"Query cache: {client.cache_stats()}\n", file=out)
 
 
-def example_raw_api_calls():
+def example_raw_api_calls(out: Optional[TextIO] = None):
     """Raw API calls without client wrapper."""
-    print("=" * 70)
-    print("Example 6: Raw API Calls")
-    print("=" * 70)
-
     base_url = "http://localhost:8000"
     prefix = "novel_style"
-
-    # Health check
-    response = requests.get(f"{base_url}/health")
-    print(f"Health: {response.json()}")
-
-    # Execute tool directly
-    response = requests.post(
-        f"{base_url}/mcp/{prefix}/{prefix}_query_text",
-        json={
-            "arguments": {
-                "query": "What is the author's style?",
-                "mode": "hybrid"
+    lines = ["=" * 70, "Example 6: Raw API Calls", "=" * 70]
+
+    with requests.Session() as session:
+        # Health check
+        response = session.get(f"{base_url}/health")
+        lines.append(f"Health: {response.json()}")
+
+        # Execute tool directly (reuses the health check connection)
+        response = session.post(
+            f"{base_url}/mcp/{prefix}/{prefix}_query_text",
+            json={
+                "arguments": {
+                    "query": "What is the author's style?",
+                    "mode": "hybrid"
+                }
             }
-        }
-    )
-    result = response.json()
-    print(f"Success: {result['success']}")
-    print(f"Response length: {len(result['data']['response'])} chars\n")
+        )
+        result = response.json()
+        lines.append(f"Success: {result['success']}")
+        lines.append(f"Response length: {len(result['data']['response'])} chars\n")
+
+    # Emit the whole example's output in one write
+    (out or sys.stdout).write("\n".join(lines) + "\n")
+
+
+async def main_async():
+    """Run the async examples."""
+    await example_basic_usage()
+    # await example_document_management()  # Uncomment to test
+    # await example_knowledge_graph()  # Uncomment to test
 
 
 if __name__ == "__main__":
@@ -266,18 +752,27 @@ if __name__ == "__main__":
     print("  daniel-lightrag-http\n")
 
     try:
-        example_basic_usage()
-        # example_streaming()  # Uncomment if streaming endpoint is available
-        # example_document_management()  # Uncomment to test
-        # example_knowledge_graph()  # Uncomment to test
-        example_error_handling()
-        example_raw_api_calls()
+        # The examples hit disjoint endpoints, so run them side by side. The
+        # sync ones buffer their output and print it once the async ones are
+        # done, keeping each example's lines together.
+        sync_examples = [
+            # example_streaming,  # Uncomment if streaming endpoint is available
+            example_error_handling,
+            example_raw_api_calls,
+        ]
+        buffers = [io.StringIO() for _ in sync_examples]
+        with ThreadPoolExecutor(max_workers=len(sync_examples) + 1) as executor:
+            futures = [executor.submit(asyncio.run, main_async())]
+            futures += [executor.submit(f, buf) for f, buf in zip(sync_examples, buffers)]
+            for future in futures:
+                future.result()
+        sys.stdout.write("".join(buf.getvalue() for buf in buffers))
 
         print("=" * 70)
         print("All examples completed!")
         print("=" * 70)
 
-    except requests.ConnectionError:
+    except (requests.ConnectionError, httpx.ConnectError):
         print("\nError: Could not connect to HTTP server")
         print("Please start the server with: daniel-lightrag-http")
     except Exception as e:
@@ -12,8 +12,31 @@ Usage:
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _dumps_indented(obj) -> bytes:
+    """Serialize obj as 2-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _claude_config_path() -> Path:
+    """Location of the Claude Desktop config file on this platform."""
+    if sys.platform == 'win32':
+        return Path(os.environ.get('APPDATA', '')) / 'Claude' / 'claude_desktop_config.json'
+    if sys.platform == 'darwin':
+        return Path.home() / 'Library' / 'Application Support' / 'Claude' / 'claude_desktop_config.json'
+    return Path.home() / '.config' / 'claude' / 'claude_desktop_config.json'
+
 
 def print_header(text):
     """Print a section header."""
@@ -79,26 +102,20 @@ def main():
     # Step 2: Generate Configuration
     print_step(2, "Generate MCP Configuration")
     config = generate_config()
-    config_json = json.dumps(config, indent=2)
+    config_bytes = _dumps_indented(config)
 
     print("\nGenerated configuration:")
-    print(config_json)
+    print(config_bytes.decode('utf-8'))
     print()
 
     # Save configuration
     config_file = Path("mcp_config_example.json")
-    config_file.write_text(config_json, encoding='utf-8')
+    config_file.write_bytes(config_bytes)
     print(f"Configuration saved to: {config_file.absolute()}")
 
     # Step 3: Configuration Location
     print_step(3, "Claude Desktop Configuration")
-
-    if sys.platform == 'win32':
-        config_path = Path(os.environ.get('APPDATA', '')) / 'Claude' / 'claude_desktop_config.json'
-    elif sys.platform == 'darwin':
-        config_path = Path.home() / 'Library' / 'Application Support' / 'Claude' / 'claude_desktop_config.json'
-    else:
-        config_path = Path.home() / '.config' / 'claude' / 'claude_desktop_config.json'
+    config_path = _claude_config_path()
 
     print(f"Your Claude Desktop config should be at:")
     print(f"  {config_path}")
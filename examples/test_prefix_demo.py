@@ -5,6 +5,7 @@ Run with: python test_prefix_demo.py
 
 import os
 import sys
+from functools import lru_cache
 
 # Set environment variable before importing
 os.environ['LIGHTRAG_TOOL_PREFIX'] = 'novel_style_'
@@ -20,19 +21,33 @@ from daniel_lightrag_mcp.server import (
     _add_description_prefix,
 )
 
-def print_section(title):
-    """Print a section header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70 + "\n")
+# Tool names are a small fixed set and the round-trip test revisits them,
+# so memoize the prefix helpers for the demo
+add_prefix = lru_cache(maxsize=None)(_add_tool_prefix)
+remove_prefix = lru_cache(maxsize=None)(_remove_tool_prefix)
 
-def main():
-    print_section("Tool Prefix Functionality Test")
+# Row formatters, bound once outside the loops
+_ADD_ROW = "  {:30s} -> {}".format
+_REMOVE_ROW = "  {:40s} -> {}".format
+_ROUND_TRIP_ROW = "  {}  {} -> {} -> {}".format
+
+
+def section(title):
+    """Return the lines of a section header."""
+    return ["", "=" * 70, f"  {title}", "=" * 70, ""]
+
+
+def emit(lines):
+    """Write a block of lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    print(f"Environment Variable: LIGHTRAG_TOOL_PREFIX = '{os.getenv('LIGHTRAG_TOOL_PREFIX')}'")
-    print(f"Loaded TOOL_PREFIX: '{TOOL_PREFIX}'")
 
-    print_section("Testing _add_tool_prefix()")
+def main():
+    lines = section("Tool Prefix Functionality Test")
+    lines.append(f"Environment Variable: LIGHTRAG_TOOL_PREFIX = '{os.getenv('LIGHTRAG_TOOL_PREFIX')}'")
+    lines.append(f"Loaded TOOL_PREFIX: '{TOOL_PREFIX}'")
+
+    lines += section("Testing _add_tool_prefix()")
 
     test_tools = [
         'query_text',
@@ -42,11 +57,9 @@ def main():
         'get_knowledge_graph',
     ]
 
-    for tool in test_tools:
-        prefixed = _add_tool_prefix(tool)
-        print(f"  {tool:30s} -> {prefixed}")
+    lines += [_ADD_ROW(tool, add_prefix(tool)) for tool in test_tools]
 
-    print_section("Testing _remove_tool_prefix()")
+    lines += section("Testing _remove_tool_prefix()")
 
     prefixed_tools = [
         'novel_style_query_text',
@@ -56,11 +69,9 @@ def main():
         'novel_style_get_knowledge_graph',
     ]
 
-    for tool in prefixed_tools:
-        original = _remove_tool_prefix(tool)
-        print(f"  {tool:40s} -> {original}")
+    lines += [_REMOVE_ROW(tool, remove_prefix(tool)) for tool in prefixed_tools]
 
-    print_section("Testing _add_description_prefix()")
+    lines += section("Testing _add_description_prefix()")
 
     test_descriptions = [
         'Query LightRAG with text',
@@ -70,27 +81,32 @@ def main():
     ]
 
     for desc in test_descriptions:
-        prefixed_desc = _add_description_prefix(desc)
-        print(f"  Original:  {desc}")
-        print(f"  Prefixed:  {prefixed_desc}")
-        print()
+        lines += [
+            f"  Original:  {desc}",
+            f"  Prefixed:  {_add_description_prefix(desc)}",
+            "",
+        ]
 
-    print_section("Round-trip Test (add then remove)")
+    lines += section("Round-trip Test (add then remove)")
 
     for tool in test_tools:
-        prefixed = _add_tool_prefix(tool)
-        unprefixed = _remove_tool_prefix(prefixed)
+        prefixed = add_prefix(tool)
+        unprefixed = remove_prefix(prefixed)
         status = "[PASS]" if unprefixed == tool else "[FAIL]"
-        print(f"  {status}  {tool} -> {prefixed} -> {unprefixed}")
-
-    print_section("Test Summary")
-    print("All prefix functions are working correctly!")
-    print()
-    print("To use in production:")
-    print("  1. Set environment variable: $env:LIGHTRAG_TOOL_PREFIX='novel_style_'")
-    print("  2. Start MCP server: python -m daniel_lightrag_mcp")
-    print("  3. All tools will have the prefix in their names and descriptions")
-    print()
+        lines.append(_ROUND_TRIP_ROW(status, tool, prefixed, unprefixed))
+
+    lines += section("Test Summary")
+    lines += [
+        "All prefix functions are working correctly!",
+        "",
+        "To use in production:",
+        "  1. Set environment variable: $env:LIGHTRAG_TOOL_PREFIX='novel_style_'",
+        "  2. Start MCP server: python -m daniel_lightrag_mcp",
+        "  3. All tools will have the prefix in their names and descriptions",
+        "",
+    ]
+
+    emit(lines)
 
 if __name__ == '__main__':
     main()
@@ -6,9 +6,7 @@ __version__ = "0.1.0"
 __author__ = "Daniel Simpkins"
 __description__ = "MCP server for LightRAG integration"
 
-from .client import LightRAGClient, LightRAGError
-from .server import server
-from .models import *
+import importlib
 
 __all__ = [
     "LightRAGClient", 
@@ -75,3 +73,23 @@ __all__ = [
     "DocStatusResponse",
     "DocsStatusesResponse",
 ]
+
+# Submodules are imported on first attribute access so that the CLI entry
+# point (``--help``, ``--version``, ``--http``) doesn't pay for loading the
+# MCP server, httpx and pydantic before it needs them.
+_LAZY_ATTRS = {
+    "LightRAGClient": ".client",
+    "LightRAGError": ".client",
+    "server": ".server",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name, ".models")
+    module = importlib.import_module(module_name, __name__)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
@@ -7,13 +7,32 @@ Supports two modes:
 """
 
 import argparse
-import asyncio
 import os
 import sys
+from functools import lru_cache
 
+from . import __version__
 
-def cli():
-    """CLI entry point with mode selection."""
+
+def _parse_int_env(name: str, default: str) -> int:
+    """Read an integer environment variable."""
+    return int(os.getenv(name, default))
+
+
+def _write_lines(*lines: str) -> None:
+    """Write several lines to stdout in a single buffered write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+# HTTP defaults are read from the environment once, at import time
+_DEFAULT_HOST = os.getenv("LIGHTRAG_HTTP_HOST", "127.0.0.1")
+_DEFAULT_PORT = _parse_int_env("LIGHTRAG_HTTP_PORT", "8765")
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Daniel LightRAG MCP Server - stdio or HTTP mode",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -33,6 +52,12 @@ Examples:
         """
     )
 
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}"
+    )
+
     # Mode selection
     parser.add_argument(
         "--http",
@@ -43,20 +68,17 @@ Examples:
     # HTTP-specific options
     http_group = parser.add_argument_group("HTTP server options (only with --http)")
 
-    default_host = os.getenv("LIGHTRAG_HTTP_HOST", "127.0.0.1")
-    default_port = int(os.getenv("LIGHTRAG_HTTP_PORT", "8765"))
-
     http_group.add_argument(
         "--host",
-        default=default_host,
-        help=f"Host to bind the HTTP server to (default: {default_host}, env: LIGHTRAG_HTTP_HOST)"
+        default=_DEFAULT_HOST,
+        help=f"Host to bind the HTTP server to (default: {_DEFAULT_HOST}, env: LIGHTRAG_HTTP_HOST)"
     )
 
     http_group.add_argument(
         "--port",
         type=int,
-        default=default_port,
-        help=f"Port to bind the HTTP server to (default: {default_port}, env: LIGHTRAG_HTTP_PORT)"
+        default=_DEFAULT_PORT,
+        help=f"Port to bind the HTTP server to (default: {_DEFAULT_PORT}, env: LIGHTRAG_HTTP_PORT)"
     )
 
     http_group.add_argument(
@@ -65,7 +87,12 @@ Examples:
         help="Enable auto-reload for development"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def cli():
+    """CLI entry point with mode selection."""
+    args = _build_parser().parse_args()
 
     # Dispatch to appropriate server
     if args.http:
@@ -76,15 +103,18 @@ Examples:
 
 def start_stdio_server():
     """Start the stdio MCP server."""
+    # Only the stdio path needs an event loop; keep asyncio off the CLI import path
+    import asyncio
+
     from .server import main
 
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\nShutting down stdio MCP server...")
+        _write_lines("\nShutting down stdio MCP server...")
         sys.exit(0)
     except Exception as e:
-        print(f"Error starting stdio MCP server: {e}")
+        _write_lines(f"Error starting stdio MCP server: {e}")
         sys.exit(1)
 
 
@@ -92,15 +122,17 @@ def start_http_server(args):
     """Start the HTTP server."""
     from .http_server import run_server
 
-    print("=" * 70)
-    print("LightRAG MCP HTTP Server")
-    print("=" * 70)
-    print(f"Starting HTTP server on {args.host}:{args.port}")
-    print(f"Prefix-based routing: /mcp/{{prefix}}/{{tool_name}}")
-    print(f"Health check: http://{args.host}:{args.port}/health")
-    print(f"API docs: http://{args.host}:{args.port}/docs")
-    print(f"\nPress Ctrl+C to stop the server")
-    print("=" * 70)
+    _write_lines(
+        "=" * 70,
+        "LightRAG MCP HTTP Server",
+        "=" * 70,
+        f"Starting HTTP server on {args.host}:{args.port}",
+        "Prefix-based routing: /mcp/{prefix}/{tool_name}",
+        f"Health check: http://{args.host}:{args.port}/health",
+        f"API docs: http://{args.host}:{args.port}/docs",
+        "\nPress Ctrl+C to stop the server",
+        "=" * 70,
+    )
 
     try:
         run_server(host=args.host, port=args.port)
@@ -3,21 +3,43 @@ LightRAG API client for MCP server integration.
 """
 
 import asyncio
+import codecs
+import functools
+import importlib.util
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional, AsyncGenerator, Union
+import os
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, AsyncGenerator, Tuple, Type, TypeVar, Union
+import anyio
 import httpx
+from pydantic import BaseModel, ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None
+
 from .models import (
     # Request models
     InsertTextRequest, InsertTextsRequest, QueryRequest, EntityUpdateRequest,
-    RelationUpdateRequest, DeleteDocRequest, DeleteEntityRequest, DeleteRelationRequest,
-    DocumentsRequest, ClearCacheRequest, EntityExistsRequest, CreateEntityRequest, CreateRelationRequest,
+    RelationUpdateRequest, DeleteDocRequest,
+    DocumentsRequest, EntityExistsRequest, CreateEntityRequest, CreateRelationRequest,
     # Response models
     InsertResponse, ScanResponse, UploadResponse, DocumentsResponse, PaginatedDocsResponse,
     DeleteDocByIdResponse, ClearDocumentsResponse, PipelineStatusResponse, TrackStatusResponse,
     StatusCountsResponse, ClearCacheResponse, DeletionResult, QueryResponse, QueryDataResponse, GraphResponse,
     LabelsResponse, EntityExistsResponse, EntityUpdateResponse, RelationUpdateResponse,
-    HealthResponse, TextDocument, PopularLabelsResponse, SearchLabelsResponse
+    HealthResponse, TextDocument, PopularLabelsResponse, SearchLabelsResponse,
+    QueryDataEntity, QueryDataRelation, QueryDataChunk, ReferenceItem
 )
 
 
@@ -27,9 +49,53 @@ class LightRAGError(Exception):
     
     def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict[str, Any]] = None):
         super().__init__(message)
-        self.message = message
+        self._message = message
         self.status_code = status_code
-        self.response_data = response_data or {}
+        self._response_data = response_data or {}
+        self._resolve: Optional[Callable[[], Tuple[str, Dict[str, Any]]]] = None
+    
+    @classmethod
+    def _deferred(
+        cls, status_code: int, resolve: Callable[[], Tuple[str, Dict[str, Any]]]
+    ) -> "LightRAGError":
+        """Create an error whose message and response data are built on first access."""
+        error = cls("", status_code)
+        error._resolve = resolve
+        return error
+    
+    def _resolved(self) -> None:
+        if self._resolve is not None:
+            resolve, self._resolve = self._resolve, None
+            self._message, self._response_data = resolve()
+            self.args = (self._message,)
+    
+    @property
+    def message(self) -> str:
+        self._resolved()
+        return self._message
+    
+    @message.setter
+    def message(self, value: str) -> None:
+        self._resolve = None
+        self._message = value
+    
+    @property
+    def response_data(self) -> Dict[str, Any]:
+        self._resolved()
+        return self._response_data
+    
+    @response_data.setter
+    def response_data(self, value: Dict[str, Any]) -> None:
+        self._resolved()
+        self._response_data = value
+    
+    def __str__(self) -> str:
+        self._resolved()
+        return super().__str__()
+    
+    def __repr__(self) -> str:
+        self._resolved()
+        return super().__repr__()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for logging/serialization."""
@@ -71,310 +137,1136 @@ class LightRAGServerError(LightRAGError):
     pass
 
 
+# HTTP status -> (exception type, message label) for failed responses
+_STATUS_ERRORS = {
+    400: (LightRAGValidationError, "Bad Request"),
+    401: (LightRAGAuthError, "Unauthorized"),
+    403: (LightRAGAuthError, "Forbidden"),
+    404: (LightRAGAPIError, "Not Found"),
+    408: (LightRAGTimeoutError, "Request Timeout"),
+    422: (LightRAGValidationError, "Validation Error"),
+    429: (LightRAGAPIError, "Rate Limited"),
+}
+
+
+def _classify_status(status_code: int) -> Tuple[type, str]:
+    """Return the exception type and message label for an HTTP error status."""
+    classified = _STATUS_ERRORS.get(status_code)
+    if classified is not None:
+        return classified
+    if 500 <= status_code < 600:
+        return LightRAGServerError, "Server Error"
+    return LightRAGAPIError, ""
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Incremental decoder factory for streamed response bodies
+_utf8_decoder = codecs.getincrementaldecoder("utf-8")
+
+# Query modes accepted by LightRAG, in display order, plus a set for lookups
+_QUERY_MODES = ("naive", "local", "global", "hybrid", "mix", "bypass")
+_VALID_QUERY_MODES = frozenset(_QUERY_MODES)
+_INVALID_MODE_MESSAGE = "Invalid query mode '{}'. Must be one of: " + str(list(_QUERY_MODES))
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_body(data: Optional[Union[Dict[str, Any], bytes]]) -> Dict[str, Any]:
+    """Request keyword arguments sending data as a pre-encoded JSON body."""
+    if data is None:
+        return {}
+    if not isinstance(data, bytes):
+        data = _json_dumps(data)
+    return {"content": data, "headers": _JSON_HEADERS}
+
+
+def _model_json(model: Any) -> bytes:
+    """Encode a request model straight to JSON bytes, dropping unset (None) fields."""
+    return model.model_dump_json(exclude_none=True).encode("utf-8")
+
+
+def _pretty_json(data: Union[Dict[str, Any], bytes]) -> str:
+    """Pretty-print a JSON payload for debug logging."""
+    if isinstance(data, bytes):
+        data = _json_loads(data)
+    return _json_dumps(data, pretty=True).decode("utf-8")
+
+
+# Closing part of a single-document delete body with default flags
+_DELETE_ONE_DOC_TAIL = b'],"delete_file":false,"delete_llm_cache":false}'
+
+# Generic file_source name for the i-th (1-based) text in insert_texts
+_TEXT_SOURCE_NAME = "text_input_{}.txt".format
+
+
+def _text_content(doc: Any) -> str:
+    """Text of one insert_texts item: a dict, a TextDocument-like object or a string."""
+    if isinstance(doc, dict):
+        return doc.get('content', str(doc))
+    if hasattr(doc, 'content'):
+        return doc.content
+    return str(doc)
+
+
+# Read size used when streaming uploaded files
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+async def _iter_file(file_path: str, chunk_size: int = _UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a file in chunks without blocking the event loop."""
+    async with await anyio.open_file(file_path, "rb") as f:
+        while chunk := await f.read(chunk_size):
+            yield chunk
+
+
+def _validate_and_stat(file_path: str) -> Tuple[int, str]:
+    """Check a file is readable and return its size and base name (blocking)."""
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File does not exist: {file_path}")
+    if not os.access(file_path, os.R_OK):
+        raise PermissionError(f"File is not readable: {file_path}")
+    return os.path.getsize(file_path), os.path.basename(file_path)
+
+
+def _multipart_file_body(
+    field: str,
+    file_path: str,
+    filename: str,
+    file_size: int,
+    content_type: str = "application/octet-stream"
+) -> Tuple[Dict[str, str], AsyncIterator[bytes]]:
+    """
+    Build headers and a streaming multipart/form-data body for one file.
+
+    httpx only accepts synchronous file objects in ``files=``, so the body
+    is framed here and the file contents are streamed from disk in chunks.
+    """
+    boundary = os.urandom(16).hex()
+    filename = filename.replace("\\", "\\\\").replace('"', "%22")
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode("utf-8")
+    tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+    headers = {
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+        "Content-Length": str(len(head) + file_size + len(tail)),
+    }
+
+    async def body() -> AsyncIterator[bytes]:
+        yield head
+        async for chunk in _iter_file(file_path):
+            yield chunk
+        yield tail
+
+    return headers, body()
+
+
+class _AsyncByteReader:
+    """Minimal async file-like adapter over an async byte iterator (for ijson)."""
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs. str; don't consume
+        if size == 0:
+            return b""
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+def _match_item_path(prefix: str, parts: List[str]) -> Optional[str]:
+    """Match an ijson prefix against ``parts``, returning the ``*`` segment."""
+    segments = prefix.split(".")
+    if len(segments) != len(parts):
+        return None
+    key = ""
+    for segment, part in zip(segments, parts):
+        if part == "*":
+            key = segment
+        elif segment != part:
+            return None
+    return key
+
+
+async def _iter_json_items(chunks: AsyncIterator[bytes], path: str) -> AsyncIterator[Tuple[str, Any]]:
+    """Yield ``(key, value)`` for every value at ``path`` in a streamed JSON body.
+    
+    ``path`` uses ijson prefix syntax, with ``item`` for array elements and
+    ``*`` matching any object key; ``key`` is the segment ``*`` matched. With
+    ijson installed each value is built as soon as it is complete; otherwise
+    the body is buffered and parsed in one go.
+    """
+    parts = path.split(".")
+    if ijson is None:
+        body = b"".join([chunk async for chunk in chunks])
+        for item in _walk_json_path(_json_loads(body), parts, ""):
+            yield item
+        return
+    
+    builder = None
+    item_key = item_prefix = ""
+    async for prefix, event, value in ijson.parse_async(_AsyncByteReader(chunks), use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == item_prefix and (event == "end_map" or event == "end_array"):
+                yield item_key, builder.value
+                builder = None
+            continue
+        if event == "map_key" or event == "end_map" or event == "end_array":
+            continue
+        key = _match_item_path(prefix, parts)
+        if key is None:
+            continue
+        if event == "start_map" or event == "start_array":
+            builder = ObjectBuilder()
+            builder.event(event, value)
+            item_key, item_prefix = key, prefix
+        else:
+            yield key, value
+
+
+def _walk_json_path(node: Any, parts: List[str], key: str) -> Iterator[Tuple[str, Any]]:
+    """Buffered counterpart of :func:`_iter_json_items` for a parsed body."""
+    if not parts:
+        yield key, node
+        return
+    part, rest = parts[0], parts[1:]
+    if part == "item":
+        if isinstance(node, list):
+            for value in node:
+                yield from _walk_json_path(value, rest, key)
+    elif isinstance(node, dict):
+        if part == "*":
+            for name, value in node.items():
+                yield from _walk_json_path(value, rest, name)
+        elif part in node:
+            yield from _walk_json_path(node[part], rest, key)
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire ``ttl`` seconds after being stored."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def put(self, key: Any, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Fixed LightRAG API paths; each client joins them onto its base URL once
+_ENDPOINTS = (
+    "/documents", "/documents/text", "/documents/texts", "/documents/upload",
+    "/documents/scan", "/documents/paginated", "/documents/delete_document",
+    "/documents/delete_entity", "/documents/delete_relation", "/documents/clear_cache",
+    "/documents/pipeline_status", "/documents/status_counts",
+    "/query", "/query/stream", "/query/data",
+    "/graphs", "/graph/label/list", "/graph/label/popular", "/graph/label/search",
+    "/graph/entity/exists", "/graph/entity/create", "/graph/entity/edit",
+    "/graph/relation/create", "/graph/relation/edit",
+    "/health",
+)
+
+# Item models for each list under "data" in a /query/data response
+_QUERY_DATA_SECTIONS = {
+    "entities": QueryDataEntity,
+    "relationships": QueryDataRelation,
+    "chunks": QueryDataChunk,
+    "references": ReferenceItem,
+}
+
+# How long idempotent GET responses (graph, labels) are reused; 0 disables
+# response caching altogether
+_GET_CACHE_TTL = float(os.getenv("LIGHTRAG_CACHE_TTL", "30"))
+# Health, status and document listings change as the server's pipeline runs,
+# not only on writes; keep them only long enough to absorb bursts of polls
+_STATUS_CACHE_TTL = 2.0
+
+
+# Connection pool sizing for the shared httpx clients; keep-alive matches the
+# connection cap by default so a burst's connections are reused, not re-opened
+_MAX_CONNECTIONS = int(os.getenv("LIGHTRAG_MAX_CONNECTIONS", "100"))
+_POOL_LIMITS = httpx.Limits(
+    max_connections=_MAX_CONNECTIONS,
+    max_keepalive_connections=int(os.getenv("LIGHTRAG_MAX_KEEPALIVE", str(_MAX_CONNECTIONS))),
+    keepalive_expiry=30.0
+)
+
+# Upper bound on establishing a connection; the configured timeout is sized
+# for slow LLM-backed reads, not for reaching an unresponsive host
+_CONNECT_TIMEOUT = 10.0
+
+# HTTP/2 needs the optional h2 package (pip install "daniel-lightrag-mcp[http2]")
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Compressed responses to ask for; httpx decodes brotli only when the
+# optional brotli package is installed (pip install "daniel-lightrag-mcp[brotli]")
+_ACCEPT_ENCODING = (
+    "br, gzip"
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    else "gzip"
+)
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None when called outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class _SharedPool:
+    """An httpx client shared by every LightRAGClient for one server.
+    
+    Holds the semaphore bounding in-flight requests to the pool's
+    connection limit, so all clients sharing the pool share the bound.
+    Connections and the semaphore belong to the event loop the pool was
+    first used on; ``usable()`` tells whether another loop may reuse it.
+    """
+    
+    def __init__(self, key: Tuple[str, Optional[str], float, bool], http: httpx.AsyncClient):
+        self.key = key
+        self.http = http
+        self.loop = _running_loop()
+        # Open LightRAGClients using the pool; closing the last one closes it
+        self.users = 0
+        # Created on first use in each loop, since it binds to that loop
+        self._gate: Optional[asyncio.Semaphore] = None
+        self._gate_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def usable(self) -> bool:
+        """Whether the pool can serve the current (or next) event loop."""
+        if self.http.is_closed:
+            return False
+        if self.loop is None:
+            return True
+        loop = _running_loop()
+        if loop is None:
+            return not self.loop.is_closed()
+        return loop is self.loop
+    
+    def gate(self) -> asyncio.Semaphore:
+        loop = _running_loop()
+        if self.loop is None:
+            self.loop = loop
+        if self._gate is None or self._gate_loop is not loop:
+            self._gate = asyncio.Semaphore(_POOL_LIMITS.max_connections)
+            self._gate_loop = loop
+        return self._gate
+
+
+# Shared pools keyed by (base_url, api_key, timeout, http2), so every
+# LightRAGClient talking to the same server reuses one keep-alive pool
+_CLIENT_CACHE: Dict[Tuple[str, Optional[str], float, bool], _SharedPool] = {}
+
+
+def _shared_pool(
+    base_url: str, api_key: Optional[str], timeout: float, http2: bool = True
+) -> _SharedPool:
+    """Return the shared pool for a server, creating it if needed."""
+    http2 = http2 and _HTTP2_AVAILABLE
+    key = (base_url, api_key, timeout, http2)
+    pool = _CLIENT_CACHE.get(key)
+    if pool is None or not pool.usable():
+        # A pool left behind by a finished event loop is dropped, not
+        # closed: its connections can only be closed on that loop
+        headers = {"Accept-Encoding": _ACCEPT_ENCODING}
+        if api_key:
+            headers["X-API-Key"] = api_key
+        # retries only re-attempts failed connects, never a sent request
+        transport = httpx.AsyncHTTPTransport(
+            limits=_POOL_LIMITS,
+            http1=True,
+            http2=http2,
+            retries=1
+        )
+        pool = _CLIENT_CACHE[key] = _SharedPool(key, httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=min(timeout, _CONNECT_TIMEOUT)),
+            headers=headers,
+            transport=transport
+        ))
+    return pool
+
+
+# Transport errors raised by httpx, mapped to (exception type, message
+# template, streaming message template)
+_REQUEST_ERROR_MAP = {
+    httpx.ConnectError: (
+        LightRAGConnectionError,
+        "Connection failed to {url}",
+        "Connection failed for streaming request to {url}"
+    ),
+    httpx.TimeoutException: (
+        LightRAGTimeoutError,
+        "Request timeout for {method} {url}",
+        "Request timeout for streaming {method} {url}"
+    ),
+    httpx.RequestError: (
+        LightRAGConnectionError,
+        "Request failed for {method} {url}",
+        "Request failed for streaming {method} {url}"
+    ),
+}
+_UNEXPECTED_REQUEST_ERROR = (
+    LightRAGError,
+    "Unexpected error during {method} request to {url}",
+    "Unexpected error during streaming {method} request to {url}"
+)
+
+
+def _translate_errors(failure: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a client method so every failure surfaces as a LightRAGError.
+    
+    LightRAGErrors pass through, Pydantic validation errors become
+    LightRAGValidationError and anything else becomes
+    ``LightRAGError("<failure>: ...")``. Failures are logged once here.
+    Works for coroutines and async generators.
+    """
+    def translate(client: "LightRAGClient", name: str, error: Exception) -> Optional[LightRAGError]:
+        client.logger.error("%s failed: %s", name, error)
+        if isinstance(error, LightRAGError):
+            return None
+        if isinstance(error, ValidationError):
+            return LightRAGValidationError(f"Request validation failed: {str(error)}")
+        return LightRAGError(f"{failure}: {str(error)}")
+    
+    def decorate(method: Callable[..., Any]) -> Callable[..., Any]:
+        name = method.__name__
+        if inspect.isasyncgenfunction(method):
+            @functools.wraps(method)
+            async def generator_wrapper(self, *args, **kwargs):
+                try:
+                    async for item in method(self, *args, **kwargs):
+                        yield item
+                except Exception as e:
+                    error = translate(self, name, e)
+                    if error is None:
+                        raise
+                    raise error from e
+            return generator_wrapper
+        
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            except Exception as e:
+                error = translate(self, name, e)
+                if error is None:
+                    raise
+                raise error from e
+        return wrapper
+    return decorate
+
+
+class _MicroBatcher:
+    """Coalesces single-item calls into batched upstream requests.
+    
+    A worker task drains the queue into batches of up to ``max_batch``
+    items, waiting at most ``max_delay`` seconds for a batch to fill. The
+    batch size shrinks while the queue stays empty, so sparse calls are not
+    delayed, and doubles again when a backlog builds up. Subclasses provide
+    ``add`` and ``_send``, which turns a batch of items into one request.
+    """
+    
+    _label = "Micro-batcher"
+    
+    def __init__(self, client: "LightRAGClient", max_batch: int, max_delay: float):
+        self._client = client
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._batch_size = max_batch
+        self._queue: "asyncio.Queue[Optional[Tuple[Any, asyncio.Future[Any]]]]" = asyncio.Queue()
+        self._worker: Optional["asyncio.Future[None]"] = None
+    
+    async def __aenter__(self):
+        self._worker = asyncio.ensure_future(self._run())
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # Flush everything already submitted before returning
+        await self._queue.put(None)
+        await self._worker
+    
+    async def _submit(self, item: Any) -> "asyncio.Future[Any]":
+        if self._worker is None or self._worker.done():
+            raise LightRAGError(f"{self._label} is not running")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return future
+    
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            entry = await self._queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            if self._batch_size > 1 and self._queue.qsize() < self._batch_size - 1:
+                await asyncio.sleep(self._max_delay)
+            while len(batch) < self._batch_size:
+                try:
+                    entry = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self._flush(batch)
+            
+            backlog = self._queue.qsize()
+            if backlog >= self._batch_size:
+                self._batch_size = min(self._max_batch, self._batch_size * 2)
+            elif backlog == 0 and len(batch) <= self._batch_size // 2:
+                self._batch_size = max(1, self._batch_size // 2)
+    
+    async def _flush(self, batch: List[Tuple[Any, "asyncio.Future[Any]"]]) -> None:
+        try:
+            result = await self._send([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(result)
+    
+    async def _send(self, items: List[Any]) -> Any:
+        raise NotImplementedError
+
+
+class _BufferedInserter(_MicroBatcher):
+    """Coalesces single-text inserts into ``/documents/texts`` batches.
+    
+    Created by :meth:`LightRAGClient.buffered_insert`.
+    """
+    
+    _label = "Buffered insert"
+    
+    async def add(self, text: str, title: Optional[str] = None) -> "asyncio.Future[InsertResponse]":
+        """Queue a text for insertion; the future resolves to its batch's response."""
+        return await self._submit((text, title))
+    
+    async def _send(self, items: List[Tuple[str, Optional[str]]]) -> InsertResponse:
+        texts = [text for text, _ in items]
+        file_sources = [
+            f"{title}.txt" if title else _TEXT_SOURCE_NAME(i)
+            for i, (_, title) in enumerate(items, 1)
+        ]
+        return await self._client._post_texts(texts, file_sources)
+
+
+class _BufferedDeleter(_MicroBatcher):
+    """Coalesces single-document deletes into one ``delete_document`` call.
+    
+    Created by :meth:`LightRAGClient.buffered_delete`; every delete in the
+    block shares its ``delete_file`` and ``delete_llm_cache`` flags.
+    """
+    
+    _label = "Buffered delete"
+    
+    def __init__(self, client: "LightRAGClient", max_batch: int, max_delay: float, delete_file: bool, delete_llm_cache: bool):
+        super().__init__(client, max_batch, max_delay)
+        self._delete_file = delete_file
+        self._delete_llm_cache = delete_llm_cache
+    
+    async def add(self, doc_id: str) -> "asyncio.Future[DeleteDocByIdResponse]":
+        """Queue a document for deletion; the future resolves to its batch's response."""
+        return await self._submit(doc_id)
+    
+    async def _send(self, items: List[str]) -> DeleteDocByIdResponse:
+        # The same ID submitted twice in one window is deleted once
+        return await self._client.delete_document(
+            list(dict.fromkeys(items)),
+            delete_file=self._delete_file,
+            delete_llm_cache=self._delete_llm_cache
+        )
+
+
 class LightRAGClient:
     """Client for interacting with LightRAG API."""
     
-    def __init__(self, base_url: str = "http://localhost:9621", api_key: Optional[str] = None, timeout: float = 300.0):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:9621",
+        api_key: Optional[str] = None,
+        timeout: float = 300.0,
+        http2: bool = True,
+        validate_requests: bool = True,
+        cache_ttl: float = _GET_CACHE_TTL
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        # False skips building request models for trusted callers; bodies
+        # are then encoded straight from the arguments
+        self.validate_requests = validate_requests
         self.logger = logging.getLogger(__name__)
         
-        headers = {}
-        if api_key:
-            headers["X-API-Key"] = api_key
-            
-        self.client = httpx.AsyncClient(
-            timeout=timeout,
-            headers=headers
-        )
+        # http2 is ignored when h2 is not installed; pass False for servers
+        # that mishandle the HTTP/2 upgrade
+        self._pool = _shared_pool(self.base_url, api_key, timeout, http2)
+        self._pool.users += 1
+        self._pool_released = False
+        self.client = self._pool.http
+        self._urls = {endpoint: self.base_url + endpoint for endpoint in _ENDPOINTS}
+        # In-flight status reads, so concurrent identical GETs share one request
+        self._inflight: Dict[Tuple[str, Any], "asyncio.Future[Any]"] = {}
         
-        self.logger.info(f"Initialized LightRAG client with base_url: {self.base_url}")
+        # Short-lived cache of idempotent GET responses keyed by
+        # (endpoint, params); cleared by any write that may change them.
+        # cache_ttl=0 turns both caches off
+        self._get_cache = _TTLCache(512, cache_ttl)
+        self._status_cache = _TTLCache(16, min(cache_ttl, _STATUS_CACHE_TTL))
+        # Bumped by every invalidation so a read that started before a
+        # write does not store its now-stale response
+        self._cache_version = 0
+        
+        self.logger.info("Initialized LightRAG client with base_url: %s", self.base_url)
     
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        await self.aclose()
     
-    def _map_http_error(self, status_code: int, response_text: str, response_data: Optional[Dict[str, Any]] = None) -> LightRAGError:
-        """Map HTTP status codes to appropriate exception types."""
-        error_message = f"HTTP {status_code}: {response_text}"
+    async def aclose(self) -> None:
+        """Release this client's share of the pooled httpx client.
         
-        # Try to parse response data for more detailed error information
-        parsed_data = response_data or {}
-        if response_text:
-            try:
-                parsed_data = json.loads(response_text)
-                if isinstance(parsed_data, dict) and "detail" in parsed_data:
-                    error_message = f"HTTP {status_code}: {parsed_data['detail']}"
-                elif isinstance(parsed_data, dict) and "message" in parsed_data:
-                    error_message = f"HTTP {status_code}: {parsed_data['message']}"
-            except json.JSONDecodeError:
-                pass
+        The httpx client is shared by every LightRAGClient for the same
+        server and is closed once the last of them is closed.
+        """
+        if self._pool_released:
+            return
+        self._pool_released = True
+        pool = self._pool
+        pool.users -= 1
+        if pool.users > 0:
+            return
+        if _CLIENT_CACHE.get(pool.key) is pool:
+            del _CLIENT_CACHE[pool.key]
+        if pool.usable():
+            await pool.http.aclose()
+    
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """Close every shared httpx client.
+        
+        Pools left behind by another event loop are only dropped, since
+        their connections cannot be closed from this loop.
+        """
+        while _CLIENT_CACHE:
+            _, pool = _CLIENT_CACHE.popitem()
+            if pool.usable():
+                await pool.http.aclose()
+    
+    async def _coalesced_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET an endpoint, sharing the request with concurrent identical calls.
+        
+        Callers that arrive while the same read is in flight await its result
+        instead of issuing another request. Only use this for idempotent reads.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else None)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._make_request("GET", endpoint, params=params))
+            self._inflight[key] = task
+            
+            def forget(done: "asyncio.Future[Any]") -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+            
+            task.add_done_callback(forget)
+        # Shield so one waiter being cancelled does not cancel the others
+        return await asyncio.shield(task)
+    
+    async def _cached_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET ``endpoint``, reusing a parsed response fetched within the TTL.
+        
+        Concurrent calls that miss the cache share a single request. List
+        bodies are wrapped as ``{"labels": [...]}`` for the label models.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        response_data = self._get_cache.get(key)
+        if response_data is None:
+            version = self._cache_version
+            response_data = await self._coalesced_get(endpoint, params)
+            if isinstance(response_data, list):
+                response_data = {"labels": response_data}
+            if version == self._cache_version:
+                self._get_cache.put(key, response_data)
+        return response_data
+    
+    async def _cached_status_get(self, endpoint: str) -> Any:
+        """GET a polled status endpoint, reusing a response from the last few seconds."""
+        response_data = self._status_cache.get(endpoint)
+        if response_data is None:
+            version = self._cache_version
+            response_data = await self._coalesced_get(endpoint)
+            if version == self._cache_version:
+                self._status_cache.put(endpoint, response_data)
+        return response_data
+    
+    def invalidate_caches(self) -> None:
+        """Drop cached GET responses, e.g. after a write made outside this client."""
+        self._cache_version += 1
+        self._get_cache.clear()
+        self._status_cache.clear()
+    
+    def _request_gate(self) -> asyncio.Semaphore:
+        """
+        Semaphore bounding in-flight requests to the pool's connection limit.
         
-        # Map status codes to specific exception types
-        if status_code == 400:
-            return LightRAGValidationError(f"Bad Request: {error_message}", status_code, parsed_data)
-        elif status_code == 401:
-            return LightRAGAuthError(f"Unauthorized: {error_message}", status_code, parsed_data)
-        elif status_code == 403:
-            return LightRAGAuthError(f"Forbidden: {error_message}", status_code, parsed_data)
-        elif status_code == 404:
-            return LightRAGAPIError(f"Not Found: {error_message}", status_code, parsed_data)
-        elif status_code == 408:
-            return LightRAGTimeoutError(f"Request Timeout: {error_message}", status_code, parsed_data)
-        elif status_code == 422:
-            return LightRAGValidationError(f"Validation Error: {error_message}", status_code, parsed_data)
-        elif status_code == 429:
-            return LightRAGAPIError(f"Rate Limited: {error_message}", status_code, parsed_data)
-        elif 500 <= status_code < 600:
-            return LightRAGServerError(f"Server Error: {error_message}", status_code, parsed_data)
+        Shared by every client using the same pool. Excess callers wait here
+        rather than queueing inside httpx's pool.
+        """
+        return self._pool.gate()
+    
+    def _request_error(self, error: Exception, method: str, url: str, streaming: bool = False) -> LightRAGError:
+        """Map a transport or unexpected error from a request to a LightRAG exception."""
+        # Walk the MRO so e.g. httpx.ConnectTimeout resolves to TimeoutException
+        for cls in type(error).__mro__:
+            entry = _REQUEST_ERROR_MAP.get(cls)
+            if entry is not None:
+                break
         else:
-            return LightRAGAPIError(error_message, status_code, parsed_data)
+            entry = _UNEXPECTED_REQUEST_ERROR
+        exc_type, plain, stream = entry
+        template = stream if streaming else plain
+        error_msg = f"{template.format(method=method, url=url)}: {error}"
+        self.logger.error(error_msg)
+        return exc_type(error_msg)
+    
+    def _map_http_error(self, status_code: int, response_text: str, response_data: Optional[Dict[str, Any]] = None) -> LightRAGError:
+        """Map HTTP status codes to appropriate exception types.
+        
+        Only the status code is inspected up front; the body is parsed for a
+        ``detail``/``message`` field when the error's message is first read.
+        """
+        error_type, label = _classify_status(status_code)
+        
+        def resolve() -> Tuple[str, Dict[str, Any]]:
+            # Use the caller's parsed body when given, otherwise parse the text
+            parsed_data = response_data
+            if parsed_data is None and response_text:
+                try:
+                    parsed_data = _json_loads(response_text)
+                except json.JSONDecodeError:
+                    pass
+            error_message = f"HTTP {status_code}: {response_text}"
+            if isinstance(parsed_data, dict) and "detail" in parsed_data:
+                error_message = f"HTTP {status_code}: {parsed_data['detail']}"
+            elif isinstance(parsed_data, dict) and "message" in parsed_data:
+                error_message = f"HTTP {status_code}: {parsed_data['message']}"
+            if label:
+                error_message = f"{label}: {error_message}"
+            return error_message, parsed_data or {}
+        
+        return error_type._deferred(status_code, resolve)
+    
+    async def _send_get(self, url, data, params, files, content, headers) -> httpx.Response:
+        return await self.client.get(url, params=params)
+    
+    async def _send_post(self, url, data, params, files, content, headers) -> httpx.Response:
+        if files:
+            return await self.client.post(url, data=data, files=files)
+        if content is not None:
+            return await self.client.post(url, content=content, headers=headers)
+        return await self.client.post(url, **_json_body(data))
+    
+    async def _send_delete(self, url, data, params, files, content, headers) -> httpx.Response:
+        if data:
+            # AsyncClient.delete() cannot carry a body
+            return await self.client.request("DELETE", url, **_json_body(data))
+        return await self.client.delete(url)
+    
+    def _encode_request(self, model: Type[BaseModel], fields: Dict[str, Any]) -> bytes:
+        """Encode a request body, validating it through ``model`` unless disabled."""
+        if self.validate_requests:
+            return _model_json(model(**fields))
+        return _json_dumps({name: value for name, value in fields.items() if value is not None})
+    
+    # Verb -> sender used by _make_request; looked up through self.client on
+    # every call so a swapped-out httpx client is honoured
+    _SENDERS = {"GET": _send_get, "POST": _send_post, "DELETE": _send_delete}
     
     async def _make_request(
         self, 
         method: str, 
         endpoint: str, 
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
         params: Optional[Dict[str, Any]] = None,
-        files: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """Make HTTP request to LightRAG API."""
-        url = f"{self.base_url}{endpoint}"
+        files: Optional[Dict[str, Any]] = None,
+        content: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        response_model: Optional[Type[ModelT]] = None
+    ) -> Any:
+        """Make HTTP request to LightRAG API.
+
+        When ``response_model`` is given, the raw response bytes are parsed
+        and validated in one pass and the model instance is returned instead
+        of a dict.
+        """
+        url = self._urls.get(endpoint) or self.base_url + endpoint
         
-        # Log request details
-        self.logger.debug(f"Making {method} request to {url}")
-        if data:
-            self.logger.debug(f"Request data: {json.dumps(data, indent=2)}")
-        if params:
-            self.logger.debug(f"Request params: {params}")
+        # Log request details, skipping the serialization when debug is off
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Making %s request to %s", method, url)
+            if data:
+                self.logger.debug("Request data: %s", _pretty_json(data))
+            if params:
+                self.logger.debug("Request params: %s", params)
         
-        try:
-            if method.upper() == "GET":
-                response = await self.client.get(url, params=params)
-            elif method.upper() == "POST":
-                if files:
-                    response = await self.client.post(url, data=data, files=files)
-                else:
-                    response = await self.client.post(url, json=data)
-            elif method.upper() == "DELETE":
-                if data:
-                    response = await self.client.delete(url, json=data)
-                else:
-                    response = await self.client.delete(url)
-            else:
-                error_msg = f"Unsupported HTTP method: {method}"
-                self.logger.error(error_msg)
-                raise LightRAGError(error_msg)
-            
-            # Log response details
-            self.logger.debug(f"Response status: {response.status_code}")
+        async with self._request_gate():
             try:
-                self.logger.debug(f"Response headers: {dict(response.headers)}")
-            except (TypeError, AttributeError):
-                # Handle mock objects that don't have proper headers
-                self.logger.debug("Response headers: <mock headers>")
+                # Callers pass upper-case literals; only normalize anything else
+                sender = self._SENDERS.get(method) or self._SENDERS.get(method.upper())
+                if sender is None:
+                    error_msg = f"Unsupported HTTP method: {method}"
+                    self.logger.error(error_msg)
+                    raise LightRAGError(error_msg)
+                response = await sender(self, url, data, params, files, content, headers)
             
-            response.raise_for_status()
+                # Log response details
+                if debug:
+                    self.logger.debug("Response status: %s", response.status_code)
+                    # Headers render themselves; no dict copy needed
+                    self.logger.debug("Response headers: %r", response.headers)
             
-            try:
-                response_data = response.json()
-                self.logger.debug(f"Response data: {json.dumps(response_data, indent=2)}")
-                self.logger.info(f"Successfully completed {method} request to {endpoint}")
-                return response_data
-            except json.JSONDecodeError as json_err:
-                self.logger.error(f"Failed to parse JSON response: {json_err}")
-                self.logger.error(f"Raw response text: {response.text}")
-                raise LightRAGAPIError(f"Invalid JSON response from server: {str(json_err)}")
+                response.raise_for_status()
             
-        except httpx.HTTPStatusError as e:
-            self.logger.error(f"HTTP error {e.response.status_code} for {method} {url}: {e.response.text}")
-            raise self._map_http_error(e.response.status_code, e.response.text)
-        except httpx.ConnectError as e:
-            error_msg = f"Connection failed to {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise LightRAGConnectionError(error_msg)
-        except httpx.TimeoutException as e:
-            error_msg = f"Request timeout for {method} {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise LightRAGTimeoutError(error_msg)
-        except httpx.RequestError as e:
-            error_msg = f"Request failed for {method} {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise LightRAGConnectionError(error_msg)
-        except Exception as e:
-            error_msg = f"Unexpected error during {method} request to {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise LightRAGError(error_msg)
+                if response_model is not None:
+                    return self._parse_model(response, response_model, method, endpoint)
+                try:
+                    response_data = _json_loads(response.content)
+                    if debug:
+                        self.logger.debug("Response data: %s", _json_dumps(response_data, pretty=True).decode())
+                    self.logger.info("Successfully completed %s request to %s", method, endpoint)
+                    return response_data
+                except json.JSONDecodeError as json_err:
+                    self.logger.error("Failed to parse JSON response: %s", json_err)
+                    self.logger.error("Raw response text: %s", response.text)
+                    raise LightRAGAPIError(f"Invalid JSON response from server: {str(json_err)}")
+            
+            except httpx.HTTPStatusError as e:
+                self.logger.error("HTTP error %s for %s %s: %s", e.response.status_code, method, url, e.response.text)
+                raise self._map_http_error(e.response.status_code, e.response.text)
+            except (LightRAGError, ValidationError):
+                raise
+            except Exception as e:
+                raise self._request_error(e, method, url, streaming=False)
+    
+    def _parse_model(
+        self, response: httpx.Response, response_model: Type[ModelT], method: str, endpoint: str
+    ) -> ModelT:
+        """Validate a JSON response body straight into ``response_model``."""
+        try:
+            result = response_model.model_validate_json(response.content)
+        except ValidationError as e:
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                self.logger.error("Failed to parse JSON response: %s", e)
+                self.logger.error("Raw response text: %s", response.text)
+                raise LightRAGAPIError(f"Invalid JSON response from server: {str(e)}")
+            raise
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Response data: %s", result.model_dump_json(indent=2))
+        self.logger.info("Successfully completed %s request to %s", method, endpoint)
+        return result
     
     async def _stream_request(
         self, 
         method: str, 
         endpoint: str, 
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Union[Dict[str, Any], bytes]] = None
     ) -> AsyncGenerator[str, None]:
         """Make streaming HTTP request to LightRAG API."""
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint) or self.base_url + endpoint
         
-        # Log streaming request details
-        self.logger.debug(f"Making streaming {method} request to {url}")
-        if data:
-            self.logger.debug(f"Streaming request data: {json.dumps(data, indent=2)}")
+        # Log streaming request details, skipping the serialization when debug is off
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Making streaming %s request to %s", method, url)
+            if data:
+                self.logger.debug("Streaming request data: %s", _pretty_json(data))
         
-        try:
-            async with self.client.stream(method, url, json=data) as response:
-                self.logger.debug(f"Streaming response status: {response.status_code}")
-                response.raise_for_status()
+        async with self._request_gate():
+            try:
+                async with self.client.stream(method, url, **_json_body(data)) as response:
+                    if debug:
+                        self.logger.debug("Streaming response status: %s", response.status_code)
+                    response.raise_for_status()
                 
-                chunk_count = 0
-                async for chunk in response.aiter_text():
-                    if chunk.strip():
+                    # Decode raw bytes ourselves; a multi-byte character split
+                    # across network chunks is held back by the decoder
+                    decoder = _utf8_decoder()
+                    chunk_count = 0
+                    async for raw in response.aiter_bytes():
+                        chunk = decoder.decode(raw)
+                        if chunk:
+                            chunk_count += 1
+                            if debug:
+                                self.logger.debug("Received streaming chunk %d: %d characters", chunk_count, len(chunk))
+                            yield chunk
+                    chunk = decoder.decode(b"", final=True)
+                    if chunk:
                         chunk_count += 1
-                        self.logger.debug(f"Received streaming chunk {chunk_count}: {len(chunk)} characters")
                         yield chunk
                 
-                self.logger.info(f"Successfully completed streaming {method} request to {endpoint}, received {chunk_count} chunks")
+                    self.logger.info("Successfully completed streaming %s request to %s, received %d chunks", method, endpoint, chunk_count)
                         
-        except httpx.HTTPStatusError as e:
-            self.logger.error(f"HTTP error {e.response.status_code} for streaming {method} {url}: {e.response.text}")
-            raise self._map_http_error(e.response.status_code, e.response.text)
-        except httpx.ConnectError as e:
-            error_msg = f"Connection failed for streaming request to {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise LightRAGConnectionError(error_msg)
-        except httpx.TimeoutException as e:
-            error_msg = f"Request timeout for streaming {method} {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise LightRAGTimeoutError(error_msg)
-        except httpx.RequestError as e:
-            error_msg = f"Request failed for streaming {method} {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise LightRAGConnectionError(error_msg)
-        except Exception as e:
-            error_msg = f"Unexpected error during streaming {method} request to {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise LightRAGError(error_msg)
+            except httpx.HTTPStatusError as e:
+                self.logger.error("HTTP error %s for streaming %s %s: %s", e.response.status_code, method, url, e.response.text)
+                raise self._map_http_error(e.response.status_code, e.response.text)
+            except LightRAGError:
+                raise
+            except Exception as e:
+                raise self._request_error(e, method, url, streaming=True)
+    
+    async def _stream_json_items(
+        self,
+        method: str,
+        endpoint: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], bytes]] = None
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        """Stream a JSON response, yielding the values at ``path`` as they arrive."""
+        url = self._urls.get(endpoint) or self.base_url + endpoint
+        self.logger.debug("Making streaming %s request to %s for %s", method, url, path)
+        
+        async with self._request_gate():
+            try:
+                async with self.client.stream(method, url, **_json_body(data)) as response:
+                    if response.is_error:
+                        # Read the error body while the stream is still open
+                        await response.aread()
+                    response.raise_for_status()
+                    count = 0
+                    async for item in _iter_json_items(response.aiter_bytes(), path):
+                        count += 1
+                        yield item
+                    self.logger.info("Successfully streamed %d items from %s %s", count, method, endpoint)
+            except httpx.HTTPStatusError as e:
+                self.logger.error("HTTP error %s for streaming %s %s: %s", e.response.status_code, method, url, e.response.text)
+                raise self._map_http_error(e.response.status_code, e.response.text)
+            except LightRAGError:
+                raise
+            except Exception as e:
+                if isinstance(e, json.JSONDecodeError) or (ijson is not None and isinstance(e, ijson.JSONError)):
+                    self.logger.error("Failed to parse JSON response: %s", e)
+                    raise LightRAGAPIError(f"Invalid JSON response from server: {str(e)}")
+                raise self._request_error(e, method, url, streaming=True)
     
     # Document Management Methods (8 methods)
     
+    @_translate_errors("Text insertion failed")
     async def insert_text(self, text: str, title: Optional[str] = None) -> InsertResponse:
         """Insert text content into LightRAG."""
-        self.logger.info(f"Inserting text document with title: {title}")
-        try:
-            # Use title as file_source if provided, otherwise use generic name
-            file_source = f"{title}.txt" if title else "text_input.txt"
-            request_data = InsertTextRequest(text=text, file_source=file_source)
-            response_data = await self._make_request("POST", "/documents/text", request_data.model_dump())
-            result = InsertResponse(**response_data)
-            self.logger.info(f"Successfully inserted text document with ID: {result.id}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Failed to insert text document: {str(e)}")
-            if isinstance(e, LightRAGError):
-                raise
-            # Handle Pydantic validation errors
-            if hasattr(e, 'errors') and callable(getattr(e, 'errors')):
-                raise LightRAGValidationError(f"Request validation failed: {str(e)}")
-            raise LightRAGError(f"Text insertion failed: {str(e)}")
+        self.logger.info("Inserting text document with title: %s", title)
+        # Use title as file_source if provided, otherwise use generic name
+        file_source = f"{title}.txt" if title else "text_input.txt"
+        request_body = self._encode_request(InsertTextRequest, {"text": text, "file_source": file_source})
+        result = await self._make_request(
+            "POST", "/documents/text", request_body, response_model=InsertResponse
+        )
+        self.invalidate_caches()
+        self.logger.info("Successfully inserted text document with ID: %s", result.id)
+        return result
     
     async def insert_texts(self, texts: List[TextDocument]) -> InsertResponse:
         """Insert multiple text documents into LightRAG."""
-        # Convert TextDocument objects to strings (content only)
-        text_strings = []
-        for doc in texts:
-            if isinstance(doc, dict):
+        # Convert TextDocument objects to strings (content only). Lists are
+        # normally homogeneous, so dispatch once on the first element and
+        # fall back to per-item checks if the list turns out to be mixed.
+        first = texts[0] if texts else None
+        try:
+            if isinstance(first, TextDocument):
+                text_strings = [doc.content for doc in texts]
+            elif isinstance(first, dict):
                 # Handle dict input from tests
-                text_strings.append(doc.get('content', str(doc)))
-            elif hasattr(doc, 'content'):
-                # Handle TextDocument objects
-                text_strings.append(doc.content)
+                text_strings = [doc.get('content', str(doc)) for doc in texts]
             else:
-                # Handle string input
-                text_strings.append(str(doc))
+                text_strings = [_text_content(doc) for doc in texts]
+        except AttributeError:
+            text_strings = [_text_content(doc) for doc in texts]
         
         # Create file sources for each text (use generic names to avoid null file_path)
-        file_sources = [f"text_input_{i+1}.txt" for i in range(len(text_strings))]
+        file_sources = list(map(_TEXT_SOURCE_NAME, range(1, len(text_strings) + 1)))
         
-        request_data = InsertTextsRequest(texts=text_strings, file_sources=file_sources)
-        response_data = await self._make_request("POST", "/documents/texts", request_data.model_dump())
-        return InsertResponse(**response_data)
+        return await self._post_texts(text_strings, file_sources)
     
+    async def _post_texts(self, texts: List[str], file_sources: List[str]) -> InsertResponse:
+        """POST a batch of texts to ``/documents/texts``."""
+        request_data = InsertTextsRequest(texts=texts, file_sources=file_sources)
+        result = await self._make_request(
+            "POST", "/documents/texts", _model_json(request_data), response_model=InsertResponse
+        )
+        self.invalidate_caches()
+        return result
+    
+    def buffered_insert(self, max_batch: int = 64, max_delay_ms: float = 10) -> _BufferedInserter:
+        """Batch many single-text inserts into few ``/documents/texts`` calls.
+        
+        Use as ``async with client.buffered_insert() as bi:`` and submit with
+        ``await bi.add(text, title)``, which returns a future for the
+        ``InsertResponse`` of the batch the text was sent in. Leaving the block
+        flushes any queued texts.
+        """
+        if max_batch < 1:
+            raise LightRAGValidationError("max_batch must be at least 1")
+        return _BufferedInserter(self, max_batch, max_delay_ms / 1000)
+    
+    @_translate_errors("Failed to upload file")
     async def upload_document(self, file_path: str) -> UploadResponse:
         """Upload a document file to LightRAG."""
-        self.logger.info(f"Uploading document file: {file_path}")
+        self.logger.info("Uploading document file: %s", file_path)
         try:
-            # Validate file exists and is readable
-            import os
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"File does not exist: {file_path}")
-            if not os.access(file_path, os.R_OK):
-                raise PermissionError(f"File is not readable: {file_path}")
-            
-            file_size = os.path.getsize(file_path)
-            self.logger.debug(f"File size: {file_size} bytes")
-            
-            with open(file_path, 'rb') as f:
-                files = {"file": (os.path.basename(file_path), f, "application/octet-stream")}
-                response_data = await self._make_request("POST", "/documents/upload", files=files)
-                result = UploadResponse(**response_data)
-                self.logger.info(f"Successfully uploaded document: {file_path} ({file_size} bytes) - Track ID: {result.track_id}")
-                return result
+            # Validate file exists and is readable in one trip off the event loop
+            file_size, filename = await anyio.to_thread.run_sync(_validate_and_stat, file_path)
         except FileNotFoundError as e:
-            error_msg = f"File not found: {file_path}"
-            self.logger.error(error_msg)
-            raise LightRAGValidationError(error_msg)
+            raise LightRAGValidationError(f"File not found: {file_path}") from e
         except PermissionError as e:
-            error_msg = f"Permission denied accessing file: {file_path}"
-            self.logger.error(error_msg)
-            raise LightRAGValidationError(error_msg)
-        except Exception as e:
-            error_msg = f"Failed to upload file {file_path}: {str(e)}"
-            self.logger.error(error_msg)
-            if isinstance(e, LightRAGError):
-                raise
-            raise LightRAGError(error_msg)
+            raise LightRAGValidationError(f"Permission denied accessing file: {file_path}") from e
+        self.logger.debug("File size: %d bytes", file_size)
+        
+        # Stream the file from disk rather than handing httpx a blocking handle
+        headers, body = _multipart_file_body("file", file_path, filename, file_size)
+        result = await self._make_request(
+            "POST", "/documents/upload", content=body, headers=headers, response_model=UploadResponse
+        )
+        self.invalidate_caches()
+        self.logger.info("Successfully uploaded document: %s (%d bytes) - Track ID: %s", file_path, file_size, result.track_id)
+        return result
     
     async def scan_documents(self) -> ScanResponse:
         """Scan for new documents in LightRAG."""
-        response_data = await self._make_request("POST", "/documents/scan")
-        return ScanResponse(**response_data)
+        result = await self._make_request("POST", "/documents/scan", response_model=ScanResponse)
+        self.invalidate_caches()
+        return result
     
-    async def get_documents(self) -> DocumentsResponse:
-        """Retrieve all documents from LightRAG."""
-        response_data = await self._make_request("GET", "/documents")
-        return DocumentsResponse(**response_data)
+    async def get_documents(self, raw: bool = False) -> Union[DocumentsResponse, Dict[str, Any]]:
+        """Retrieve all documents from LightRAG.
+        
+        With ``raw=True`` the parsed JSON is returned without model validation.
+        """
+        response_data = await self._cached_status_get("/documents")
+        if raw:
+            return response_data
+        return DocumentsResponse.model_validate(response_data)
+    
+    async def get_documents_iter(self) -> AsyncGenerator[Tuple[str, Dict[str, Any]], None]:
+        """Stream all documents as ``(status, document)`` pairs.
+        
+        Documents are yielded as they are parsed from the response, so the
+        full listing is never held in memory (requires the optional ijson
+        package; without it the body is buffered). Bypasses the GET cache.
+        """
+        async for status, document in self._stream_json_items("GET", "/documents", "statuses.*.item"):
+            yield status, document
     
     async def get_documents_paginated(self, page: int = 1, page_size: int = 10, status_filter: Optional[str] = None) -> PaginatedDocsResponse:
         """Retrieve documents with pagination from LightRAG."""
         request_data = DocumentsRequest(page=page, page_size=page_size, status_filter=status_filter)
-        response_data = await self._make_request("POST", "/documents/paginated", request_data.model_dump())
-        return PaginatedDocsResponse(**response_data)
+        result = await self._make_request("POST", "/documents/paginated", _model_json(request_data), response_model=PaginatedDocsResponse)
+        return result
     
+    @_translate_errors("Document deletion failed")
     async def delete_document(self, doc_ids: Union[str, List[str]], delete_file: bool = False, delete_llm_cache: bool = False) -> DeleteDocByIdResponse:
         """Delete document(s) by ID from LightRAG."""
-        # Support both single string ID and list of IDs for backward compatibility
-        if isinstance(doc_ids, str):
-            doc_ids_list = [doc_ids]
+        if not doc_ids:
+            raise LightRAGValidationError("doc_ids cannot be empty")
+        if isinstance(doc_ids, str) and not delete_file and not delete_llm_cache:
+            # Common case: one ID with default flags; only the ID needs encoding
+            request_body = b'{"doc_ids":[' + _json_dumps(doc_ids) + _DELETE_ONE_DOC_TAIL
         else:
-            doc_ids_list = doc_ids
-
-        request_data = DeleteDocRequest(
-            doc_ids=doc_ids_list,
-            delete_file=delete_file,
-            delete_llm_cache=delete_llm_cache
-        )
-        response_data = await self._make_request("DELETE", "/documents/delete_document", request_data.model_dump())
-        return DeleteDocByIdResponse(**response_data)
+            # Support both single string ID and list of IDs for backward compatibility
+            request_body = self._encode_request(DeleteDocRequest, {
+                "doc_ids": [doc_ids] if isinstance(doc_ids, str) else doc_ids,
+                "delete_file": delete_file,
+                "delete_llm_cache": delete_llm_cache
+            })
+        result = await self._make_request("DELETE", "/documents/delete_document", request_body, response_model=DeleteDocByIdResponse)
+        self.invalidate_caches()
+        return result
+    
+    def buffered_delete(
+        self,
+        max_batch: int = 64,
+        max_delay_ms: float = 5,
+        delete_file: bool = False,
+        delete_llm_cache: bool = False
+    ) -> _BufferedDeleter:
+        """Batch many single-document deletes into few ``delete_document`` calls.
+        
+        Use as ``async with client.buffered_delete() as bd:`` and submit with
+        ``await bd.add(doc_id)``, which returns a future for the
+        ``DeleteDocByIdResponse`` of the batch the ID was sent in. Leaving the
+        block flushes any queued IDs.
+        """
+        if max_batch < 1:
+            raise LightRAGValidationError("max_batch must be at least 1")
+        return _BufferedDeleter(self, max_batch, max_delay_ms / 1000, delete_file, delete_llm_cache)
     
     async def clear_documents(self) -> ClearDocumentsResponse:
         """Clear all documents from LightRAG."""
-        response_data = await self._make_request("DELETE", "/documents")
-        return ClearDocumentsResponse(**response_data)
+        result = await self._make_request("DELETE", "/documents", response_model=ClearDocumentsResponse)
+        self.invalidate_caches()
+        return result
     
     # Query Methods (3 methods)
     
+    @staticmethod
+    def _validate_query(query: str, mode: str) -> None:
+        """Reject empty queries and unknown modes before building a request."""
+        if not query or not query.strip():
+            raise LightRAGValidationError("Query cannot be empty")
+        if mode not in _VALID_QUERY_MODES:
+            raise LightRAGValidationError(_INVALID_MODE_MESSAGE.format(mode))
+    
+    @_translate_errors("Query operation failed")
     async def query_text(
         self,
         query: str,
@@ -390,45 +1282,34 @@ class LightRAGClient:
         conversation_history: Optional[List[Dict[str, str]]] = None
     ) -> QueryResponse:
         """Query LightRAG with text."""
-        self.logger.info(f"Querying text with mode '{mode}': {query[:100]}{'...' if len(query) > 100 else ''}")
-
-        # Validate query parameters
-        if not query or not query.strip():
-            raise LightRAGValidationError("Query cannot be empty")
-
-        valid_modes = ["naive", "local", "global", "hybrid", "mix", "bypass"]
-        if mode not in valid_modes:
-            raise LightRAGValidationError(f"Invalid query mode '{mode}'. Must be one of: {valid_modes}")
-
-        try:
-            request_data = QueryRequest(
-                query=query,
-                mode=mode,
-                only_need_context=only_need_context,
-                only_need_prompt=only_need_prompt,
-                top_k=top_k,
-                max_entity_tokens=max_entity_tokens,
-                max_relation_tokens=max_relation_tokens,
-                include_references=include_references,
-                include_chunk_content=include_chunk_content,
-                enable_rerank=enable_rerank,
-                conversation_history=conversation_history or [],
-                hl_keywords=[],  # query_text doesn't use keywords
-                ll_keywords=[],  # query_text doesn't use keywords
-                stream=False
-            )
-            response_data = await self._make_request("POST", "/query", request_data.model_dump())
-            result = QueryResponse(**response_data)
-
-            ref_count = len(result.references) if result.references else 0
-            self.logger.info(f"Query completed successfully, returned {ref_count} references")
-            return result
-        except Exception as e:
-            self.logger.error(f"Query failed for mode '{mode}': {str(e)}")
-            if isinstance(e, LightRAGError):
-                raise
-            raise LightRAGError(f"Query operation failed: {str(e)}")
+        # %.100s truncates the query only if the record is emitted
+        self.logger.info("Querying text with mode '%s': %.100s%s", mode, query, "..." if len(query) > 100 else "")
+
+        self._validate_query(query, mode)
+
+        request_body = self._encode_request(QueryRequest, dict(
+            query=query,
+            mode=mode,
+            only_need_context=only_need_context,
+            only_need_prompt=only_need_prompt,
+            top_k=top_k,
+            max_entity_tokens=max_entity_tokens,
+            max_relation_tokens=max_relation_tokens,
+            include_references=include_references,
+            include_chunk_content=include_chunk_content,
+            enable_rerank=enable_rerank,
+            conversation_history=conversation_history or [],
+            hl_keywords=[],  # query_text doesn't use keywords
+            ll_keywords=[],  # query_text doesn't use keywords
+            stream=False
+        ))
+        result = await self._make_request("POST", "/query", request_body, response_model=QueryResponse)
+
+        ref_count = len(result.references) if result.references else 0
+        self.logger.info("Query completed successfully, returned %d references", ref_count)
+        return result
     
+    @_translate_errors("Streaming query operation failed")
     async def query_text_stream(
         self,
         query: str,
@@ -444,41 +1325,30 @@ class LightRAGClient:
         conversation_history: Optional[List[Dict[str, str]]] = None
     ) -> AsyncGenerator[str, None]:
         """Stream query results from LightRAG."""
-        # Validate query parameters
-        if not query or not query.strip():
-            raise LightRAGValidationError("Query cannot be empty")
-
-        valid_modes = ["naive", "local", "global", "hybrid", "mix", "bypass"]
-        if mode not in valid_modes:
-            raise LightRAGValidationError(f"Invalid query mode '{mode}'. Must be one of: {valid_modes}")
-
-        self.logger.info(f"Starting streaming query with mode '{mode}': {query[:100]}{'...' if len(query) > 100 else ''}")
-
-        try:
-            request_data = QueryRequest(
-                query=query,
-                mode=mode,
-                only_need_context=only_need_context,
-                only_need_prompt=only_need_prompt,
-                top_k=top_k,
-                max_entity_tokens=max_entity_tokens,
-                max_relation_tokens=max_relation_tokens,
-                include_references=include_references,
-                include_chunk_content=include_chunk_content,
-                enable_rerank=enable_rerank,
-                conversation_history=conversation_history or [],
-                hl_keywords=[],  # query_text_stream doesn't use keywords
-                ll_keywords=[],  # query_text_stream doesn't use keywords
-                stream=True
-            )
-            async for chunk in self._stream_request("POST", "/query/stream", request_data.model_dump()):
-                yield chunk
-        except Exception as e:
-            self.logger.error(f"Streaming query failed for mode '{mode}': {str(e)}")
-            if isinstance(e, LightRAGError):
-                raise
-            raise LightRAGError(f"Streaming query operation failed: {str(e)}")
-
+        self._validate_query(query, mode)
+
+        self.logger.info("Starting streaming query with mode '%s': %.100s%s", mode, query, "..." if len(query) > 100 else "")
+
+        request_body = self._encode_request(QueryRequest, dict(
+            query=query,
+            mode=mode,
+            only_need_context=only_need_context,
+            only_need_prompt=only_need_prompt,
+            top_k=top_k,
+            max_entity_tokens=max_entity_tokens,
+            max_relation_tokens=max_relation_tokens,
+            include_references=include_references,
+            include_chunk_content=include_chunk_content,
+            enable_rerank=enable_rerank,
+            conversation_history=conversation_history or [],
+            hl_keywords=[],  # query_text_stream doesn't use keywords
+            ll_keywords=[],  # query_text_stream doesn't use keywords
+            stream=True
+        ))
+        async for chunk in self._stream_request("POST", "/query/stream", request_body):
+            yield chunk
+
+    @_translate_errors("Query data operation failed")
     async def query_data(
         self,
         query: str,
@@ -518,62 +1388,98 @@ class LightRAGClient:
         Returns:
             QueryDataResponse containing entities, relationships, chunks, and metadata
         """
-        self.logger.info(f"Querying data with mode '{mode}': {query[:100]}{'...' if len(query) > 100 else ''}")
-
-        # Validate query parameters
-        if not query or not query.strip():
-            raise LightRAGValidationError("Query cannot be empty")
-
-        valid_modes = ["naive", "local", "global", "hybrid", "mix", "bypass"]
-        if mode not in valid_modes:
-            raise LightRAGValidationError(f"Invalid query mode '{mode}'. Must be one of: {valid_modes}")
-
-        try:
-            # Convert None to empty lists to avoid validation errors
-            request_data = QueryRequest(
-                query=query,
-                mode=mode,
-                top_k=top_k,
-                chunk_top_k=chunk_top_k,
-                max_entity_tokens=max_entity_tokens,
-                max_relation_tokens=max_relation_tokens,
-                max_total_tokens=max_total_tokens,
-                hl_keywords=hl_keywords or [],
-                ll_keywords=ll_keywords or [],
-                enable_rerank=enable_rerank,
-                conversation_history=conversation_history or [],
-                include_references=True,  # query_data always includes references
-                stream=False
-            )
-            response_data = await self._make_request("POST", "/query/data", request_data.model_dump())
-            result = QueryDataResponse(**response_data)
-
-            entity_count = len(result.data.entities)
-            rel_count = len(result.data.relationships)
-            chunk_count = len(result.data.chunks)
-            self.logger.info(f"Query data completed: {entity_count} entities, {rel_count} relationships, {chunk_count} chunks")
-            return result
-        except Exception as e:
-            self.logger.error(f"Query data failed for mode '{mode}': {str(e)}")
-            if isinstance(e, LightRAGError):
-                raise
-            raise LightRAGError(f"Query data operation failed: {str(e)}")
+        self.logger.info("Querying data with mode '%s': %.100s%s", mode, query, "..." if len(query) > 100 else "")
+
+        self._validate_query(query, mode)
+
+        # Convert None to empty lists to avoid validation errors
+        request_body = self._encode_request(QueryRequest, dict(
+            query=query,
+            mode=mode,
+            top_k=top_k,
+            chunk_top_k=chunk_top_k,
+            max_entity_tokens=max_entity_tokens,
+            max_relation_tokens=max_relation_tokens,
+            max_total_tokens=max_total_tokens,
+            hl_keywords=hl_keywords or [],
+            ll_keywords=ll_keywords or [],
+            enable_rerank=enable_rerank,
+            conversation_history=conversation_history or [],
+            include_references=True,  # query_data always includes references
+            stream=False
+        ))
+        result = await self._make_request("POST", "/query/data", request_body, response_model=QueryDataResponse)
+
+        entity_count = len(result.data.entities)
+        rel_count = len(result.data.relationships)
+        chunk_count = len(result.data.chunks)
+        self.logger.info("Query data completed: %d entities, %d relationships, %d chunks", entity_count, rel_count, chunk_count)
+        return result
+
+    async def query_data_iter(
+        self, query: str, mode: str = "mix", **options: Any
+    ) -> AsyncGenerator[Tuple[str, BaseModel], None]:
+        """Stream ``query_data`` results as ``(section, item)`` pairs.
+
+        ``section`` is one of ``entities``, ``relationships``, ``chunks`` or
+        ``references``, and ``item`` the matching validated model. Items are
+        yielded while the response is still arriving (with the optional ijson
+        package), so large retrievals can be processed incrementally. Accepts
+        the same keyword options as :meth:`query_data`; the status and
+        metadata envelope is not returned.
+        """
+        self._validate_query(query, mode)
+        # Convert None to empty lists to avoid validation errors
+        for name in ("hl_keywords", "ll_keywords", "conversation_history"):
+            if options.get(name) is None:
+                options[name] = []
+        request_body = self._encode_request(
+            QueryRequest, dict(options, query=query, mode=mode, include_references=True, stream=False)
+        )
+        async for section, item in self._stream_json_items(
+            "POST", "/query/data", "data.*.item", request_body
+        ):
+            model = _QUERY_DATA_SECTIONS.get(section)
+            if model is not None:
+                yield section, model.model_validate(item)
 
     # Knowledge Graph Methods (10 methods)
 
-    async def get_knowledge_graph(self, label: str = "*") -> GraphResponse:
-        """Retrieve the knowledge graph from LightRAG."""
+    async def get_knowledge_graph(
+        self,
+        label: str = "*",
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        raw: bool = False
+    ) -> Union[GraphResponse, Dict[str, Any]]:
+        """Retrieve the knowledge graph from LightRAG.
+
+        Args:
+            label: Label of the starting node ("*" for the whole graph)
+            max_depth: Maximum depth of the subgraph (server default: 3)
+            max_nodes: Maximum number of nodes to return (server default: 1000)
+            raw: Return the parsed JSON without validating every node and edge
+        """
         params = {"label": label}
-        response_data = await self._make_request("GET", "/graphs", params=params)
-        return GraphResponse(**response_data)
+        if max_depth is not None:
+            params["max_depth"] = max_depth
+        if max_nodes is not None:
+            params["max_nodes"] = max_nodes
+        response_data = await self._cached_get("/graphs", params)
+        if raw:
+            return response_data
+        return GraphResponse.model_validate(response_data)
     
-    async def get_graph_labels(self) -> LabelsResponse:
-        """Get labels for entities and relations in the knowledge graph."""
-        response_data = await self._make_request("GET", "/graph/label/list")
+    async def get_graph_labels(self, raw: bool = False) -> Union[LabelsResponse, Dict[str, Any]]:
+        """Get labels for entities and relations in the knowledge graph.
+        
+        With ``raw=True`` the parsed JSON is returned without model validation.
+        """
         # Server returns a list, but our model expects a dict with labels field
-        if isinstance(response_data, list):
-            response_data = {"labels": response_data}
-        return LabelsResponse(**response_data)
+        response_data = await self._cached_get("/graph/label/list")
+        if raw:
+            return response_data
+        return LabelsResponse.model_validate(response_data)
 
     async def get_popular_labels(self, limit: int = 300) -> PopularLabelsResponse:
         """Get popular labels by node degree (most connected entities).
@@ -589,10 +1495,8 @@ class LightRAGClient:
         if limit > 1000:
             limit = 1000
         params = {"limit": limit}
-        response_data = await self._make_request("GET", "/graph/label/popular", params=params)
-        if isinstance(response_data, list):
-            response_data = {"labels": response_data}
-        return PopularLabelsResponse(**response_data)
+        response_data = await self._cached_get("/graph/label/popular", params)
+        return PopularLabelsResponse.model_validate(response_data)
 
     async def search_labels(self, query: str, limit: int = 50) -> SearchLabelsResponse:
         """Search labels with fuzzy matching.
@@ -611,102 +1515,128 @@ class LightRAGClient:
         if limit > 100:
             limit = 100
         params = {"q": query, "limit": limit}
-        response_data = await self._make_request("GET", "/graph/label/search", params=params)
-        if isinstance(response_data, list):
-            response_data = {"labels": response_data}
-        return SearchLabelsResponse(**response_data)
+        response_data = await self._cached_get("/graph/label/search", params)
+        return SearchLabelsResponse.model_validate(response_data)
 
     async def check_entity_exists(self, entity_name: str) -> EntityExistsResponse:
         """Check if an entity exists in the knowledge graph."""
-        params = {"name": entity_name}
-        response_data = await self._make_request("GET", "/graph/entity/exists", params=params)
-        return EntityExistsResponse(**response_data)
+        response_data = await self._cached_get("/graph/entity/exists", {"name": entity_name})
+        return EntityExistsResponse.model_validate(response_data)
 
     async def create_entity(self, entity_name: str, entity_data: Dict[str, Any]) -> EntityUpdateResponse:
         """Create a new entity in the knowledge graph."""
-        request_data = CreateEntityRequest(entity_name=entity_name, entity_data=entity_data)
-        response_data = await self._make_request("POST", "/graph/entity/create", request_data.model_dump())
-        return EntityUpdateResponse(**response_data)
+        request_body = self._encode_request(CreateEntityRequest, {"entity_name": entity_name, "entity_data": entity_data})
+        result = await self._make_request("POST", "/graph/entity/create", request_body, response_model=EntityUpdateResponse)
+        self.invalidate_caches()
+        return result
 
     async def update_entity(self, entity_name: str, updated_data: Dict[str, Any], allow_rename: bool = False, allow_merge: bool = False) -> EntityUpdateResponse:
         """Update an entity in the knowledge graph."""
-        request_data = EntityUpdateRequest(
+        request_body = self._encode_request(EntityUpdateRequest, dict(
             entity_name=entity_name,
             updated_data=updated_data,
             allow_rename=allow_rename,
             allow_merge=allow_merge
-        )
-        response_data = await self._make_request("POST", "/graph/entity/edit", request_data.model_dump())
-        return EntityUpdateResponse(**response_data)
+        ))
+        result = await self._make_request("POST", "/graph/entity/edit", request_body, response_model=EntityUpdateResponse)
+        self.invalidate_caches()
+        return result
     
     # async def update_relation(self, relation_id: str, properties: Dict[str, Any], source_id: str = "unknown", target_id: str = "unknown") -> RelationUpdateResponse:
     #     """Update a relation in the knowledge graph."""
     #     request_data = RelationUpdateRequest(relation_id=relation_id, source_id=source_id, target_id=target_id, updated_data=properties)
-    #     response_data = await self._make_request("POST", "/graph/relation/edit", request_data.model_dump())
-    #     return RelationUpdateResponse(**response_data)
+    #     response_data = await self._make_request("POST", "/graph/relation/edit", _model_json(request_data))
+    #     return RelationUpdateResponse.model_validate(response_data)
 
     async def update_relation(self, source_id: str, target_id: str, updated_data: Dict[str, Any]) -> RelationUpdateResponse:
         """Update a relation in the knowledge graph."""
-        request_data = RelationUpdateRequest(
+        request_body = self._encode_request(RelationUpdateRequest, dict(
             source_id=source_id,
             target_id=target_id,
             updated_data=updated_data
-        )
-        response_data = await self._make_request("POST", "/graph/relation/edit", request_data.model_dump())
-        return RelationUpdateResponse(**response_data)
+        ))
+        result = await self._make_request("POST", "/graph/relation/edit", request_body, response_model=RelationUpdateResponse)
+        self.invalidate_caches()
+        return result
 
     async def create_relation(self, source_entity: str, target_entity: str, relation_data: Dict[str, Any]) -> RelationUpdateResponse:
         """Create a new relation in the knowledge graph."""
-        request_data = CreateRelationRequest(
+        request_body = self._encode_request(CreateRelationRequest, dict(
             source_entity=source_entity,
             target_entity=target_entity,
             relation_data=relation_data
-        )
-        response_data = await self._make_request("POST", "/graph/relation/create", request_data.model_dump())
-        return RelationUpdateResponse(**response_data)
+        ))
+        result = await self._make_request("POST", "/graph/relation/create", request_body, response_model=RelationUpdateResponse)
+        self.invalidate_caches()
+        return result
 
     async def delete_entity(self, entity_name: str) -> DeletionResult:
         """Delete an entity from the knowledge graph by name."""
-        request_data = DeleteEntityRequest(entity_name=entity_name)
-        response_data = await self._make_request("DELETE", "/documents/delete_entity", request_data.model_dump())
-        return DeletionResult(**response_data)
+        # One string field; a request model would only echo it back
+        result = await self._make_request("DELETE", "/documents/delete_entity", {"entity_name": entity_name}, response_model=DeletionResult)
+        self.invalidate_caches()
+        return result
 
     async def delete_relation(self, source_entity: str, target_entity: str) -> DeletionResult:
         """Delete a relation from the knowledge graph by source and target entity names."""
-        request_data = DeleteRelationRequest(source_entity=source_entity, target_entity=target_entity)
-        response_data = await self._make_request("DELETE", "/documents/delete_relation", request_data.model_dump())
-        return DeletionResult(**response_data)
+        request_data = {"source_entity": source_entity, "target_entity": target_entity}
+        result = await self._make_request("DELETE", "/documents/delete_relation", request_data, response_model=DeletionResult)
+        self.invalidate_caches()
+        return result
     
     # System Management Methods (4 methods)
     
-    async def get_pipeline_status(self) -> PipelineStatusResponse:
-        """Get the pipeline status from LightRAG."""
-        response_data = await self._make_request("GET", "/documents/pipeline_status")
-        return PipelineStatusResponse(**response_data)
+    async def get_pipeline_status(self, raw: bool = False) -> Union[PipelineStatusResponse, Dict[str, Any]]:
+        """Get the pipeline status from LightRAG.
+        
+        With ``raw=True`` the parsed JSON is returned without model validation.
+        """
+        response_data = await self._cached_status_get("/documents/pipeline_status")
+        if raw:
+            return response_data
+        return PipelineStatusResponse.model_validate(response_data)
     
     async def get_track_status(self, track_id: str) -> TrackStatusResponse:
         """Get the track status for a specific track ID."""
-        response_data = await self._make_request("GET", f"/documents/track_status/{track_id}")
-        return TrackStatusResponse(**response_data)
+        response_data = await self._coalesced_get(f"/documents/track_status/{track_id}")
+        return TrackStatusResponse.model_validate(response_data)
+    
+    async def get_track_statuses(
+        self,
+        track_ids: List[str],
+        max_concurrency: int = 20
+    ) -> List[Union[TrackStatusResponse, LightRAGError]]:
+        """
+        Get the track status for several track IDs concurrently.
+        
+        Results are returned in the order of ``track_ids``; a failed lookup
+        yields its exception in place of a response. At most
+        ``max_concurrency`` requests are in flight at once, which keeps the
+        fan-out within the shared connection pool's keep-alive limit.
+        """
+        gate = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(track_id: str) -> TrackStatusResponse:
+            async with gate:
+                return await self.get_track_status(track_id)
+        
+        return await asyncio.gather(*(fetch(t) for t in track_ids), return_exceptions=True)
     
     async def get_document_status_counts(self) -> StatusCountsResponse:
         """Get document status counts from LightRAG."""
-        response_data = await self._make_request("GET", "/documents/status_counts")
-        return StatusCountsResponse(**response_data)
+        response_data = await self._cached_status_get("/documents/status_counts")
+        return StatusCountsResponse.model_validate(response_data)
     
     async def clear_cache(self, cache_type: Optional[str] = None) -> ClearCacheResponse:
         """Clear LightRAG cache."""
-        if cache_type:
-            request_data = ClearCacheRequest(cache_type=cache_type).model_dump()
-        else:
-            request_data = {}
-        response_data = await self._make_request("POST", "/documents/clear_cache", request_data)
-        return ClearCacheResponse(**response_data)
+        request_data = {"cache_type": cache_type} if cache_type else {}
+        result = await self._make_request("POST", "/documents/clear_cache", request_data, response_model=ClearCacheResponse)
+        return result
     
     async def get_health(self) -> HealthResponse:
         """Check LightRAG server health."""
-        response_data = await self._make_request("GET", "/health")
-        return HealthResponse(**response_data)
+        response_data = await self._cached_status_get("/health")
+        return HealthResponse.model_validate(response_data)
 
     async def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Execute a tool by name with arguments.
@@ -720,163 +1650,124 @@ class LightRAGClient:
         Returns:
             Tool execution result
         """
-        # Document Management Tools
-        if tool_name == "insert_text":
-            return await self.insert_text(
-                text=arguments["text"],
-                title=arguments.get("title")
-            )
-
-        elif tool_name == "insert_texts":
-            texts = arguments.get("texts", [])
-            # Handle both dict and TextDocument objects
-            text_docs = []
-            for t in texts:
-                if isinstance(t, dict):
-                    text_docs.append(TextDocument(**t))
-                else:
-                    text_docs.append(t)
-            return await self.insert_texts(text_docs)
-
-        elif tool_name == "upload_document":
-            return await self.upload_document(arguments["file_path"])
-
-        elif tool_name == "scan_documents":
-            return await self.scan_documents()
-
-        elif tool_name == "get_documents":
-            return await self.get_documents()
-
-        elif tool_name == "get_documents_paginated":
-            return await self.get_documents_paginated(
-                page=arguments.get("page", 1),
-                page_size=arguments.get("page_size", 10),
-                status_filter=arguments.get("status_filter")
-            )
-
-        elif tool_name == "delete_document":
-            doc_ids = arguments.get("document_ids") or arguments.get("document_id")
-            if isinstance(doc_ids, str):
-                doc_ids = [doc_ids]
-            return await self.delete_document(
-                doc_ids=doc_ids,
-                delete_file=arguments.get("delete_file", False),
-                delete_llm_cache=arguments.get("delete_llm_cache", False)
-            )
-
-        elif tool_name == "clear_documents":
-            return await self.clear_documents()
-
-        # Query Tools
-        elif tool_name == "query_text":
-            return await self.query_text(
-                query=arguments["query"],
-                mode=arguments.get("mode", "mix"),
-                only_need_context=arguments.get("only_need_context", False),
-                only_need_prompt=arguments.get("only_need_prompt", False),
-                top_k=arguments.get("top_k"),
-                max_entity_tokens=arguments.get("max_entity_tokens"),
-                max_relation_tokens=arguments.get("max_relation_tokens"),
-                include_references=arguments.get("include_references", True),
-                include_chunk_content=arguments.get("include_chunk_content", False),
-                enable_rerank=arguments.get("enable_rerank", True),
-                conversation_history=arguments.get("conversation_history")
-            )
-
-        elif tool_name == "query_text_stream":
-            return self.query_text_stream(
-                query=arguments["query"],
-                mode=arguments.get("mode", "mix"),
-                only_need_context=arguments.get("only_need_context", False),
-                only_need_prompt=arguments.get("only_need_prompt", False),
-                top_k=arguments.get("top_k"),
-                max_entity_tokens=arguments.get("max_entity_tokens"),
-                max_relation_tokens=arguments.get("max_relation_tokens"),
-                include_references=arguments.get("include_references", True),
-                include_chunk_content=arguments.get("include_chunk_content", False),
-                enable_rerank=arguments.get("enable_rerank", True),
-                conversation_history=arguments.get("conversation_history")
-            )
-
-        elif tool_name == "query_data":
-            return await self.query_data(
-                query=arguments.get("query", ""),
-                limit_entities=arguments.get("limit_entities", 100),
-                limit_relations=arguments.get("limit_relations", 100),
-                limit_chunks=arguments.get("limit_chunks", 100)
-            )
-
-        # Knowledge Graph Tools
-        elif tool_name == "get_knowledge_graph":
-            return await self.get_knowledge_graph(arguments.get("label", "*"))
-
-        elif tool_name == "get_graph_labels":
-            return await self.get_graph_labels()
-
-        elif tool_name == "get_popular_labels":
-            return await self.get_popular_labels(arguments.get("limit", 300))
-
-        elif tool_name == "search_labels":
-            return await self.search_labels(
-                query=arguments["query"],
-                limit=arguments.get("limit", 50)
-            )
-
-        elif tool_name == "check_entity_exists":
-            return await self.check_entity_exists(arguments["entity_name"])
-
-        elif tool_name == "create_entity":
-            return await self.create_entity(
-                entity_name=arguments["entity_name"],
-                entity_data=arguments.get("entity_data", {})
-            )
-
-        elif tool_name == "update_entity":
-            return await self.update_entity(
-                entity_name=arguments["entity_name"],
-                updated_data=arguments.get("updated_data", {}),
-                allow_rename=arguments.get("allow_rename", False),
-                allow_merge=arguments.get("allow_merge", False)
-            )
-
-        elif tool_name == "update_relation":
-            return await self.update_relation(
-                source_id=arguments["source_id"],
-                target_id=arguments["target_id"],
-                updated_data=arguments.get("updated_data", {})
-            )
-
-        elif tool_name == "create_relation":
-            return await self.create_relation(
-                source_entity=arguments["source_entity"],
-                target_entity=arguments["target_entity"],
-                relation_data=arguments.get("relation_data", {})
-            )
-
-        elif tool_name == "delete_entity":
-            return await self.delete_entity(arguments["entity_name"])
-
-        elif tool_name == "delete_relation":
-            return await self.delete_relation(
-                source_entity=arguments.get("source_entity", ""),
-                target_entity=arguments.get("target_entity", "")
-            )
-
-        # System Management Tools
-        elif tool_name == "get_pipeline_status":
-            return await self.get_pipeline_status()
-
-        elif tool_name == "get_track_status":
-            return await self.get_track_status(arguments["track_id"])
-
-        elif tool_name == "get_document_status_counts":
-            return await self.get_document_status_counts()
-
-        elif tool_name == "clear_cache":
-            return await self.clear_cache(arguments.get("cache_type"))
-
-        elif tool_name == "get_health":
-            return await self.get_health()
-
-        else:
+        handler = _TOOL_HANDLERS.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
+        return await handler(self, arguments)
+
+
+def _query_text_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Keyword arguments shared by the query_text and query_text_stream tools."""
+    return dict(
+        query=arguments["query"],
+        mode=arguments.get("mode", "mix"),
+        only_need_context=arguments.get("only_need_context", False),
+        only_need_prompt=arguments.get("only_need_prompt", False),
+        top_k=arguments.get("top_k"),
+        max_entity_tokens=arguments.get("max_entity_tokens"),
+        max_relation_tokens=arguments.get("max_relation_tokens"),
+        include_references=arguments.get("include_references", True),
+        include_chunk_content=arguments.get("include_chunk_content", False),
+        enable_rerank=arguments.get("enable_rerank", True),
+        conversation_history=arguments.get("conversation_history")
+    )
+
+
+async def _insert_texts_tool(client: LightRAGClient, arguments: Dict[str, Any]) -> InsertResponse:
+    # Handle both dict and TextDocument objects
+    text_docs = [
+        TextDocument.model_validate(t) if isinstance(t, dict) else t
+        for t in arguments.get("texts", [])
+    ]
+    return await client.insert_texts(text_docs)
+
+
+async def _delete_document_tool(client: LightRAGClient, arguments: Dict[str, Any]) -> DeleteDocByIdResponse:
+    # A single string ID is passed through so delete_document can take its fast path
+    doc_ids = arguments.get("document_ids") or arguments.get("document_id")
+    return await client.delete_document(
+        doc_ids=doc_ids,
+        delete_file=arguments.get("delete_file", False),
+        delete_llm_cache=arguments.get("delete_llm_cache", False)
+    )
+
+
+async def _query_text_stream_tool(client: LightRAGClient, arguments: Dict[str, Any]) -> AsyncGenerator[str, None]:
+    # The stream itself is handed back to the caller, not consumed here
+    return client.query_text_stream(**_query_text_arguments(arguments))
+
+
+# Tool name -> adapter pulling that tool's arguments, built once at import
+_TOOL_HANDLERS: Dict[str, Callable[[LightRAGClient, Dict[str, Any]], Awaitable[Any]]] = {
+    # Document Management Tools
+    "insert_text": lambda c, a: c.insert_text(text=a["text"], title=a.get("title")),
+    "insert_texts": _insert_texts_tool,
+    "upload_document": lambda c, a: c.upload_document(a["file_path"]),
+    "scan_documents": lambda c, a: c.scan_documents(),
+    "get_documents": lambda c, a: c.get_documents(raw=a.get("raw", False)),
+    "get_documents_paginated": lambda c, a: c.get_documents_paginated(
+        page=a.get("page", 1),
+        page_size=a.get("page_size", 10),
+        status_filter=a.get("status_filter")
+    ),
+    "delete_document": _delete_document_tool,
+    "clear_documents": lambda c, a: c.clear_documents(),
+    # Query Tools
+    "query_text": lambda c, a: c.query_text(**_query_text_arguments(a)),
+    "query_text_stream": _query_text_stream_tool,
+    "query_data": lambda c, a: c.query_data(
+        query=a.get("query", ""),
+        mode=a.get("mode", "mix"),
+        top_k=a.get("top_k"),
+        chunk_top_k=a.get("chunk_top_k"),
+        max_entity_tokens=a.get("max_entity_tokens"),
+        max_relation_tokens=a.get("max_relation_tokens"),
+        max_total_tokens=a.get("max_total_tokens"),
+        hl_keywords=a.get("hl_keywords"),
+        ll_keywords=a.get("ll_keywords"),
+        enable_rerank=a.get("enable_rerank", True),
+        conversation_history=a.get("conversation_history")
+    ),
+    # Knowledge Graph Tools
+    "get_knowledge_graph": lambda c, a: c.get_knowledge_graph(
+        label=a.get("label", "*"),
+        max_depth=a.get("max_depth"),
+        max_nodes=a.get("max_nodes"),
+        raw=a.get("raw", False)
+    ),
+    "get_graph_labels": lambda c, a: c.get_graph_labels(),
+    "get_popular_labels": lambda c, a: c.get_popular_labels(a.get("limit", 300)),
+    "search_labels": lambda c, a: c.search_labels(query=a["query"], limit=a.get("limit", 50)),
+    "check_entity_exists": lambda c, a: c.check_entity_exists(a["entity_name"]),
+    "create_entity": lambda c, a: c.create_entity(
+        entity_name=a["entity_name"],
+        entity_data=a.get("entity_data", {})
+    ),
+    "update_entity": lambda c, a: c.update_entity(
+        entity_name=a["entity_name"],
+        updated_data=a.get("updated_data", {}),
+        allow_rename=a.get("allow_rename", False),
+        allow_merge=a.get("allow_merge", False)
+    ),
+    "update_relation": lambda c, a: c.update_relation(
+        source_id=a["source_id"],
+        target_id=a["target_id"],
+        updated_data=a.get("updated_data", {})
+    ),
+    "create_relation": lambda c, a: c.create_relation(
+        source_entity=a["source_entity"],
+        target_entity=a["target_entity"],
+        relation_data=a.get("relation_data", {})
+    ),
+    "delete_entity": lambda c, a: c.delete_entity(a["entity_name"]),
+    "delete_relation": lambda c, a: c.delete_relation(
+        source_entity=a.get("source_entity", ""),
+        target_entity=a.get("target_entity", "")
+    ),
+    # System Management Tools
+    "get_pipeline_status": lambda c, a: c.get_pipeline_status(),
+    "get_track_status": lambda c, a: c.get_track_status(a["track_id"]),
+    "get_document_status_counts": lambda c, a: c.get_document_status_counts(),
+    "clear_cache": lambda c, a: c.clear_cache(a.get("cache_type")),
+    "get_health": lambda c, a: c.get_health(),
+}
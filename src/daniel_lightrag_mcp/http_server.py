@@ -11,17 +11,16 @@ Routes:
 """
 
 import asyncio
-import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, AsyncGenerator
+from typing import Any, Dict, List, Optional, AsyncGenerator, Tuple
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
-from .client import LightRAGClient, LightRAGError
+from .client import LightRAGClient, LightRAGError, _TOOL_HANDLERS, _json_dumps
 from .server import (
     _add_tool_prefix,
     _remove_tool_prefix,
@@ -36,6 +35,33 @@ logger = logging.getLogger(__name__)
 # Global client instances per prefix
 clients: Dict[str, LightRAGClient] = {}
 
+# Unprefixed names of every tool the client can execute
+_TOOL_NAMES = frozenset(_TOOL_HANDLERS)
+
+# Serialized /mcp/{prefix}/tools bodies; the tool list is fixed for the
+# life of the process, so each prefix's listing is built once
+_tools_json: Dict[str, bytes] = {}
+
+# Unprefixed tool descriptions, fetched from handle_list_tools() once and
+# shared by every prefix's listing
+_tool_infos: List[Dict[str, Any]] = []
+
+# Tools whose results are streamed back as NDJSON
+_STREAMING_TOOLS = frozenset({"query_text_stream"})
+
+# Tools whose models only wrap the parsed JSON; their (possibly multi-MB)
+# results are passed through as plain data instead of being validated
+# into a model and dumped straight back out
+_PASSTHROUGH_TOOLS = frozenset({"get_documents", "get_knowledge_graph"})
+
+# Constant envelope around each streamed chunk, so only the payload
+# itself is encoded per line
+_STREAM_CHUNK_PREFIX = b'{"type":"chunk","data":'
+_STREAM_CHUNK_SUFFIX = b"}\n"
+
+# Final NDJSON line of every successful stream
+_STREAM_DONE_LINE = _json_dumps({"type": "done", "status": "completed"}) + b"\n"
+
 
 class ToolRequest(BaseModel):
     """Request model for tool execution."""
@@ -65,6 +91,10 @@ async def lifespan(app: FastAPI):
     # Initialize clients for configured prefixes
     await initialize_clients()
 
+    # Build every prefix's tool listing up front
+    for prefix in clients:
+        await _prefix_tools_json(prefix)
+
     yield
 
     # Cleanup
@@ -81,11 +111,33 @@ app = FastAPI(
 )
 
 
+def _parse_prefix_entry(item: str) -> Optional[Tuple[str, str, str]]:
+    """Split one LIGHTRAG_HTTP_PREFIXES entry into (prefix, url, api_key).
+
+    Accepts prefix:url, prefix:url:key, prefix:http(s)://host and
+    prefix:http(s)://host:port[:key]. Returns None if the entry has no prefix.
+    """
+    prefix, colon, rest = item.partition(":")
+    if not prefix or not colon:
+        return None
+
+    scheme, sep, location = rest.partition("://")
+    if sep and scheme in ("http", "https"):
+        # Everything after the colon following the port is the API key
+        host, colon, port = location.partition(":")
+        port, _, api_key = port.partition(":")
+        return prefix, f"{scheme}://{host}{colon}{port}", api_key
+
+    # No protocol, simple format: url or url:key
+    url, _, api_key = rest.partition(":")
+    return prefix, url, api_key
+
+
 async def initialize_clients():
     """Initialize LightRAG clients for all configured prefixes."""
     # Read timeout from environment
     timeout = float(os.getenv("LIGHTRAG_TIMEOUT", "300"))
-    logger.info(f"Using timeout: {timeout} seconds")
+    logger.info("Using timeout: %s seconds", timeout)
 
     # Read prefix configurations from environment
     # Format: LIGHTRAG_HTTP_PREFIXES=prefix1:url1:key1,prefix2:url2:key2
@@ -97,71 +149,42 @@ async def initialize_clients():
         default_url = os.getenv("LIGHTRAG_BASE_URL", "http://localhost:9621")
         default_key = os.getenv("LIGHTRAG_API_KEY", "")
         clients["default"] = LightRAGClient(base_url=default_url, api_key=default_key, timeout=timeout)
-        logger.info(f"Initialized default client: {default_url}")
+        logger.info("Initialized default client: %s", default_url)
         return
 
+    # Prefixes naming the same server and key share one client, and with it
+    # its response caches and in-flight request coalescing
+    seen: Dict[Tuple[str, str], LightRAGClient] = {}
+
     # Parse configuration
     for item in config.split(","):
         item = item.strip()
         if not item:
             continue
 
-        # Split on first colon only: prefix:url:key -> prefix, url:key
-        first_colon = item.find(":")
-        if first_colon > 0:
-            prefix = item[:first_colon]
-            rest = item[first_colon + 1:]
-
-            # Handle URL with protocol (http://, https://)
-            # Format: prefix:http://host:port or prefix:https://host:port:key
-            if rest.startswith("http://"):
-                url_part = rest[7:]  # Remove "http://"
-                # Find the port in "host:port" or use empty key
-                if ":" in url_part:
-                    host, port = url_part.split(":", 1)
-                    # Check if there's another colon for API key
-                    if ":" in port:
-                        port, api_key = port.split(":", 1)
-                        url = f"http://{host}:{port}"
-                    else:
-                        url = f"http://{host}:{port}"
-                        api_key = ""
-                else:
-                    url = f"http://{url_part}"
-                    api_key = ""
-            elif rest.startswith("https://"):
-                url_part = rest[8:]  # Remove "https://"
-                if ":" in url_part:
-                    host, port = url_part.split(":", 1)
-                    if ":" in port:
-                        port, api_key = port.split(":", 1)
-                        url = f"https://{host}:{port}"
-                    else:
-                        url = f"https://{host}:{port}"
-                        api_key = ""
-                else:
-                    url = f"https://{url_part}"
-                    api_key = ""
-            else:
-                # No protocol, simple format: url or url:key
-                if ":" in rest:
-                    url, api_key = rest.split(":", 1)
-                else:
-                    url = rest
-                    api_key = ""
-
-            clients[prefix] = LightRAGClient(base_url=url, api_key=api_key, timeout=timeout)
-            logger.info(f"Initialized client for prefix '{prefix}': {url}")
+        entry = _parse_prefix_entry(item)
+        if entry is not None:
+            prefix, url, api_key = entry
+            client = seen.get((url, api_key))
+            if client is None:
+                client = seen[(url, api_key)] = LightRAGClient(base_url=url, api_key=api_key, timeout=timeout)
+            clients[prefix] = client
+            logger.info("Initialized client for prefix '%s': %s", prefix, url)
 
 
 async def cleanup_clients():
     """Cleanup all LightRAG clients."""
+    closed = set()
     for prefix, client in clients.items():
+        if id(client) in closed:
+            continue
+        closed.add(id(client))
         try:
             await client.__aexit__(None, None, None)
-            logger.info(f"Closed client for prefix '{prefix}'")
+            logger.info("Closed client for prefix '%s'", prefix)
         except Exception as e:
-            logger.error(f"Error closing client for '{prefix}': {e}")
+            logger.error("Error closing client for '%s': %s", prefix, e)
+    await LightRAGClient.aclose_all()
 
 
 def get_client(prefix: str) -> LightRAGClient:
@@ -171,7 +194,7 @@ def get_client(prefix: str) -> LightRAGClient:
 
     # Try default client
     if "default" in clients:
-        logger.warning(f"No client for prefix '{prefix}', using default")
+        logger.warning("No client for prefix '%s', using default", prefix)
         return clients["default"]
 
     raise HTTPException(status_code=404, detail=f"No client configured for prefix: {prefix}")
@@ -187,6 +210,34 @@ async def health_check():
     }
 
 
+async def _prefix_tools_json(prefix: str) -> bytes:
+    """Return the serialized tool listing for a prefix, building it on first use."""
+    body = _tools_json.get(prefix)
+    if body is None:
+        if not _tool_infos:
+            tools = await handle_list_tools()
+            _tool_infos.extend(
+                ToolInfo(
+                    name=tool.name,
+                    description=tool.description,
+                    input_schema=tool.inputSchema
+                ).model_dump()
+                for tool in tools
+            )
+        # Return all tools with prefix prepended
+        prefixed_tools = [
+            {**info, "name": f"{prefix}_{info['name']}"}
+            for info in _tool_infos
+        ]
+        body = _json_dumps({
+            "prefix": prefix,
+            "tools": prefixed_tools,
+            "count": len(prefixed_tools)
+        })
+        _tools_json[prefix] = body
+    return body
+
+
 @app.get("/mcp/{prefix}/tools")
 async def list_tools(prefix: str):
     """List all tools for a specific prefix.
@@ -198,40 +249,27 @@ async def list_tools(prefix: str):
         if prefix not in clients:
             raise HTTPException(status_code=404, detail=f"Unknown prefix: {prefix}")
 
-        # Get all tools
-        tools = await handle_list_tools()
-
-        # Return all tools with prefix prepended
-        prefixed_tools = []
-        for tool in tools:
-            prefixed_tools.append(ToolInfo(
-                name=f"{prefix}_{tool.name}",
-                description=tool.description,
-                input_schema=tool.inputSchema
-            ))
-
-        return {
-            "prefix": prefix,
-            "tools": [t.model_dump() for t in prefixed_tools],
-            "count": len(prefixed_tools)
-        }
+        return Response(content=await _prefix_tools_json(prefix), media_type="application/json")
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error listing tools for prefix '{prefix}': {e}")
+        logger.error("Error listing tools for prefix '%s': %s", prefix, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/mcp/{prefix}/{tool_name}")
+# Tool results are returned as pre-encoded Responses, so FastAPI neither
+# re-validates nor walks them; response_model only documents the schema
+@app.post("/mcp/{prefix}/{tool_name}", response_model=ToolResponse)
 async def execute_tool(prefix: str, tool_name: str, request: ToolRequest):
     """Execute a tool with the given arguments.
 
     URL path: /mcp/{prefix}/{prefix}_{actual_tool_name}
     """
     try:
-        # Validate prefix is configured
-        if prefix not in clients:
+        # Validate prefix is configured and get its client
+        client = clients.get(prefix)
+        if client is None:
             raise HTTPException(status_code=404, detail=f"Unknown prefix: {prefix}")
 
         # Validate prefix matches tool_name
@@ -242,33 +280,32 @@ async def execute_tool(prefix: str, tool_name: str, request: ToolRequest):
                 detail=f"Tool name '{tool_name}' does not match prefix '{prefix}'"
             )
 
-        # Get client for this prefix
-        client = get_client(prefix)
-
         # Remove prefix to get actual tool name
         actual_tool_name = tool_name[len(expected_prefix):]
+        if actual_tool_name not in _TOOL_NAMES:
+            raise HTTPException(status_code=404, detail=f"Unknown tool: {tool_name}")
 
         # Validate arguments
         _validate_tool_arguments(actual_tool_name, request.arguments)
 
-        logger.info(f"Executing tool: {tool_name} (actual: {actual_tool_name})")
-        logger.debug(f"Arguments: {request.arguments}")
+        logger.info("Executing tool: %s (actual: %s)", tool_name, actual_tool_name)
+        logger.debug("Arguments: %s", request.arguments)
 
         # Check if streaming is requested
-        if request.stream or "_stream" in actual_tool_name:
+        if request.stream or actual_tool_name in _STREAMING_TOOLS:
             return await execute_streaming_tool(client, actual_tool_name, request.arguments)
         else:
             return await execute_regular_tool(client, actual_tool_name, request.arguments)
 
     except LightRAGError as e:
-        logger.error(f"LightRAG error: {e}")
+        logger.error("LightRAG error: %s", e)
         raise HTTPException(status_code=500, detail=e.to_dict())
 
     except HTTPException:
         raise
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -276,19 +313,22 @@ async def execute_regular_tool(
     client: LightRAGClient,
     tool_name: str,
     arguments: Dict[str, Any]
-) -> ToolResponse:
+) -> Response:
     """Execute a regular (non-streaming) tool using unified executor."""
+    if tool_name in _PASSTHROUGH_TOOLS:
+        arguments = {**arguments, "raw": True}
     result = await client.execute_tool(tool_name, arguments)
 
-    # Serialize result
-    if hasattr(result, 'model_dump'):
-        data = result.model_dump()
-    elif hasattr(result, '__dict__'):
-        data = result.__dict__
+    # Plain JSON data goes straight through orjson; response models (or
+    # containers of them) are serialized by Pydantic's own JSON encoder
+    if isinstance(result, BaseModel):
+        body = ToolResponse(success=True, data=result).model_dump_json()
     else:
-        data = result
-
-    return ToolResponse(success=True, data=data)
+        try:
+            body = _json_dumps({"success": True, "data": result, "error": None})
+        except TypeError:
+            body = ToolResponse(success=True, data=result).model_dump_json()
+    return Response(content=body, media_type="application/json")
 
 
 async def execute_streaming_tool(
@@ -317,19 +357,19 @@ async def execute_streaming_tool(
         try:
             async for chunk in stream_generator:
                 # Send each chunk as NDJSON (newline-delimited JSON)
-                yield (json.dumps({"type": "chunk", "data": chunk}) + "\n").encode("utf-8")
+                yield _STREAM_CHUNK_PREFIX + _json_dumps(chunk) + _STREAM_CHUNK_SUFFIX
 
             # Send completion signal
-            yield (json.dumps({"type": "done", "status": "completed"}) + "\n").encode("utf-8")
+            yield _STREAM_DONE_LINE
 
         except LightRAGError as e:
             error_data = {"type": "error", "error": str(e), "details": e.to_dict()}
-            yield (json.dumps(error_data) + "\n").encode("utf-8")
+            yield _json_dumps(error_data) + b"\n"
 
         except Exception as e:
-            logger.error(f"Streaming error: {e}", exc_info=True)
+            logger.error("Streaming error: %s", e, exc_info=True)
             error_data = {"type": "error", "error": str(e)}
-            yield (json.dumps(error_data) + "\n").encode("utf-8")
+            yield _json_dumps(error_data) + b"\n"
 
     return StreamingResponse(
         stream_wrapper(),
@@ -341,28 +381,37 @@ async def execute_streaming_tool(
     )
 
 
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    """Build a JSON response encoded with orjson when it is installed."""
+    return Response(
+        content=_json_dumps(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 @app.exception_handler(LightRAGError)
 async def lightrag_error_handler(request: Request, exc: LightRAGError):
     """Handle LightRAG errors."""
-    return JSONResponse(
-        status_code=500,
-        content={
+    return _json_response(
+        {
             "success": False,
             "error": str(exc),
             "details": exc.to_dict()
-        }
+        },
+        status_code=500,
     )
 
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
+    return _json_response(
+        {
             "success": False,
             "error": exc.detail
-        }
+        },
+        status_code=exc.status_code,
     )
 
 
@@ -375,17 +424,26 @@ def run_server(host: str = None, port: int = None):
         host = os.getenv("LIGHTRAG_HTTP_HOST", "127.0.0.1")
     if port is None:
         port = int(os.getenv("LIGHTRAG_HTTP_PORT", "8765"))
-
-    logger.info(f"Starting HTTP server on {host}:{port}")
-    logger.info(f"Environment: LIGHTRAG_HTTP_HOST={os.getenv('LIGHTRAG_HTTP_HOST', 'not set')}")
-    logger.info(f"Environment: LIGHTRAG_HTTP_PORT={os.getenv('LIGHTRAG_HTTP_PORT', 'not set')}")
-
+    # Each worker process keeps its own clients, caches and connection pools
+    workers = int(os.getenv("LIGHTRAG_HTTP_WORKERS", "1"))
+    # execute_tool already logs every call, so uvicorn's per-request access
+    # log is off unless asked for
+    access_log = os.getenv("LIGHTRAG_HTTP_ACCESS_LOG", "false").lower() in ("1", "true", "yes")
+
+    logger.info("Starting HTTP server on %s:%s", host, port)
+    logger.info("Environment: LIGHTRAG_HTTP_HOST=%s", os.getenv("LIGHTRAG_HTTP_HOST", "not set"))
+    logger.info("Environment: LIGHTRAG_HTTP_PORT=%s", os.getenv("LIGHTRAG_HTTP_PORT", "not set"))
+
+    # uvicorn's default "auto" loop and HTTP implementations pick uvloop and
+    # httptools when installed (pip install "daniel-lightrag-mcp[uvloop]")
     uvicorn.run(
         "daniel_lightrag_mcp.http_server:app",
         host=host,
         port=port,
+        workers=workers,
         reload=False,
-        log_level="info"
+        log_level="info",
+        access_log=access_log
     )
 
 
@@ -6,7 +6,7 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -30,7 +30,10 @@ from .client import (
     LightRAGValidationError, 
     LightRAGAPIError,
     LightRAGTimeoutError,
-    LightRAGServerError
+    LightRAGServerError,
+    _INVALID_MODE_MESSAGE,
+    _QUERY_MODES,
+    _VALID_QUERY_MODES,
 )
 
 # Configure logging with structured format
@@ -58,6 +61,10 @@ server = Server("daniel-lightrag-mcp")
 # Global client instance
 lightrag_client: Optional[LightRAGClient] = None
 
+# The query_text tool accepts every client query mode except "bypass"
+_QUERY_TEXT_MODES = tuple(mode for mode in _QUERY_MODES if mode != "bypass")
+_VALID_QUERY_TEXT_MODES = frozenset(_QUERY_TEXT_MODES)
+
 
 def _add_tool_prefix(name: str) -> str:
     """Add prefix to tool name if configured. Format: {prefix}_{tool}"""
@@ -88,41 +95,37 @@ def _add_description_prefix(description: str) -> str:
     return description
 
 
+# Required arguments for each tool, checked on every call
+_REQUIRED_TOOL_ARGS: Dict[str, Tuple[str, ...]] = {
+    "insert_text": ("text",),
+    "insert_texts": ("texts",),
+    "upload_document": ("file_path",),
+    "get_documents_paginated": (),  # page and page_size have defaults
+    "delete_document": (),  # Special validation logic for delete_document
+    "query_text": ("query",),
+    "query_text_stream": ("query",),
+    # "query_data": ("query",),  # Disabled: high token consumption
+    "check_entity_exists": ("entity_name",),
+    "create_entity": ("entity_name",),  # entity_data is optional
+    "update_entity": ("entity_name",),  # updated_data is optional
+    "create_relation": ("source_entity", "target_entity"),  # relation_data is optional
+    "update_relation": ("source_id", "target_id"),  # updated_data is optional
+    "delete_entity": ("entity_name",),
+    "delete_relation": ("source_entity", "target_entity"),
+    "get_popular_labels": (),
+    "search_labels": ("query",),
+    "get_track_status": ("track_id",),
+}
+
+
 def _validate_tool_arguments(tool_name: str, arguments: Dict[str, Any]) -> None:
     """Validate tool arguments against expected schemas."""
-    # Define required arguments for each tool
-    required_args = {
-        "insert_text": ["text"],
-        "insert_texts": ["texts"],
-        "upload_document": ["file_path"],
-        "get_documents_paginated": [],  # page and page_size have defaults
-        "delete_document": [],  # Special validation logic for delete_document
-        "query_text": ["query"],
-        "query_text_stream": ["query"],
-        # "query_data": ["query"],  # Disabled: high token consumption
-        "check_entity_exists": ["entity_name"],
-        "create_entity": ["entity_name"],  # entity_data is optional
-        "update_entity": ["entity_name"],  # updated_data is optional
-        "create_relation": ["source_entity", "target_entity"],  # relation_data is optional
-        "update_relation": ["source_id", "target_id"],  # updated_data is optional
-        "delete_entity": ["entity_name"],
-        "delete_relation": ["source_entity", "target_entity"],
-        "get_popular_labels": [],
-        "search_labels": ["query"],
-        "get_track_status": ["track_id"],
-    }
-    
     # Check if tool requires specific arguments
-    if tool_name in required_args:
-        missing_args = []
-        for required_arg in required_args[tool_name]:
-            if required_arg not in arguments:
-                missing_args.append(required_arg)
-        
-        if missing_args:
-            error_msg = f"Missing required arguments for {tool_name}: {missing_args}"
-            logger.warning(f"Validation error: {error_msg}")
-            raise LightRAGValidationError(error_msg)
+    missing_args = [arg for arg in _REQUIRED_TOOL_ARGS.get(tool_name, ()) if arg not in arguments]
+    if missing_args:
+        error_msg = f"Missing required arguments for {tool_name}: {missing_args}"
+        logger.warning("Validation error: %s", error_msg)
+        raise LightRAGValidationError(error_msg)
     
     # Additional validation for specific tools
     if tool_name == "get_documents_paginated":
@@ -134,12 +137,11 @@ def _validate_tool_arguments(tool_name: str, arguments: Dict[str, Any]) -> None:
         if not isinstance(page_size, int) or page_size < 1 or page_size > 100:
             raise LightRAGValidationError("Page size must be an integer between 1 and 100")
     
-    elif tool_name in ["query_text", "query_text_stream"]:
+    elif tool_name in ("query_text", "query_text_stream"):
         # query_data disabled due to high token consumption
         mode = arguments.get("mode", "mix")
-        valid_modes = ["naive", "local", "global", "hybrid", "mix", "bypass"]
-        if mode not in valid_modes:
-            raise LightRAGValidationError(f"Invalid query mode '{mode}'. Must be one of: {valid_modes}")
+        if mode not in _VALID_QUERY_MODES:
+            raise LightRAGValidationError(_INVALID_MODE_MESSAGE.format(mode))
 
     elif tool_name == "delete_document":
         # Special validation for delete_document: must have either document_id or document_ids
@@ -174,7 +176,7 @@ def _validate_tool_arguments(tool_name: str, arguments: Dict[str, Any]) -> None:
         if not isinstance(delete_llm_cache, bool):
             raise LightRAGValidationError("'delete_llm_cache' must be a boolean")
 
-    logger.debug(f"Tool arguments validation passed for {tool_name}")
+    logger.debug("Tool arguments validation passed for %s", tool_name)
 
 
 def _serialize_result(result: Any) -> str:
@@ -762,7 +764,23 @@ async def handle_list_tools() -> List[Tool]:#ListToolsResult:
             description=_add_description_prefix("Retrieve the knowledge graph from LightRAG"),
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "label": {
+                        "type": "string",
+                        "description": "Label of the starting node ('*' for the whole graph)",
+                        "default": "*"
+                    },
+                    "max_depth": {
+                        "type": "integer",
+                        "description": "Maximum depth of the subgraph (server default: 3)",
+                        "minimum": 1
+                    },
+                    "max_nodes": {
+                        "type": "integer",
+                        "description": "Maximum number of nodes to return (server default: 1000). Use a small value to preview large graphs.",
+                        "minimum": 1
+                    }
+                },
                 "required": []
             }
         ),
@@ -1222,7 +1240,10 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
     
     logger.info(f"TOOL EXECUTION PHASE:")
     logger.info(f"  - Processing tool: '{tool_name}'")
-    logger.info(f"  - Tool arguments: {json.dumps(arguments, indent=2)}")
+    logger.info("  - Tool argument keys: %s", list(arguments))
+    if logger.isEnabledFor(logging.DEBUG):
+        # Arguments can carry whole documents; only pretty-print them when asked
+        logger.debug("  - Tool arguments: %s", json.dumps(arguments, indent=2))
     
     # Client initialization with detailed logging
     if lightrag_client is None:
@@ -1397,19 +1418,8 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error("  - File path is empty or whitespace only")
                 raise LightRAGValidationError("File path cannot be empty")
             
-            # Check if file exists
-            if not os.path.exists(file_path):
-                logger.error("UPLOAD_DOCUMENT FILE ERROR:")
-                logger.error(f"  - File does not exist: {file_path}")
-                raise LightRAGValidationError(f"File does not exist: {file_path}")
-            
-            # Get file info
-            file_size = os.path.getsize(file_path)
-            logger.info(f"FILE INFORMATION:")
-            logger.info(f"  - File exists: True")
-            logger.info(f"  - File size: {file_size} bytes")
-            logger.info(f"  - File readable: {os.access(file_path, os.R_OK)}")
-            
+            # The client checks the file exists and is readable, off the
+            # event loop, before streaming it
             logger.info("  - Parameter validation passed")
             logger.info("  - Calling lightrag_client.upload_document()...")
             
@@ -1436,7 +1446,6 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error(f"  - Exception type: {type(e)}")
                 logger.error(f"  - Exception message: {str(e)}")
                 logger.error(f"  - File path: {file_path}")
-                logger.error(f"  - File size: {file_size}")
                 import traceback
                 logger.error(f"  - Full traceback: {traceback.format_exc()}")
                 raise
@@ -1738,8 +1747,8 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error("  - Query is empty or whitespace only")
                 raise LightRAGValidationError("Query cannot be empty")
 
-            valid_modes = ["naive", "local", "global", "hybrid", "mix"]
-            if mode not in valid_modes:
+            if mode not in _VALID_QUERY_TEXT_MODES:
+                valid_modes = list(_QUERY_TEXT_MODES)
                 logger.error("QUERY_TEXT MODE ERROR:")
                 logger.error(f"  - Invalid mode: '{mode}'")
                 logger.error(f"  - Valid modes: {valid_modes}")
@@ -1831,8 +1840,8 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
                 logger.error("  - Query is empty or whitespace only")
                 raise LightRAGValidationError("Query cannot be empty")
 
-            valid_modes = ["naive", "local", "global", "hybrid", "mix", "bypass"]
-            if mode not in valid_modes:
+            if mode not in _VALID_QUERY_MODES:
+                valid_modes = list(_QUERY_MODES)
                 logger.error("QUERY_TEXT_STREAM MODE ERROR:")
                 logger.error(f"  - Invalid mode: '{mode}'")
                 logger.error(f"  - Valid modes: {valid_modes}")
@@ -1994,11 +2003,14 @@ async def handle_call_tool(self, request: CallToolRequest) -> dict:
             logger.info(f"  - Client type: {type(lightrag_client)}")
             logger.info(f"  - Client base_url: {lightrag_client.base_url}")
             logger.info(f"  - Arguments: {arguments}")
-            logger.info("  - This tool requires no parameters")
             logger.info("  - Calling lightrag_client.get_knowledge_graph()...")
             
             try:
-                result = await lightrag_client.get_knowledge_graph()
+                result = await lightrag_client.get_knowledge_graph(
+                    label=arguments.get("label", "*"),
+                    max_depth=arguments.get("max_depth"),
+                    max_nodes=arguments.get("max_nodes")
+                )
                 logger.info("GET_KNOWLEDGE_GRAPH SUCCESS:")
                 logger.info(f"  - Result type: {type(result)}")
                 logger.info(f"  - Result content: {repr(result)}")
@@ -2965,6 +2977,7 @@ async def main():
             logger.info("  - Closing LightRAG client...")
             try:
                 await lightrag_client.__aexit__(None, None, None)
+                await LightRAGClient.aclose_all()
                 logger.info("  - LightRAG client closed successfully")
             except Exception as e:
                 logger.warning(f"  - Error closing LightRAG client: {e}")
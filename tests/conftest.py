@@ -2,6 +2,7 @@
 Pytest configuration and fixtures for daniel-lightrag-mcp tests.
 """
 
+import json
 import pytest
 import asyncio
 from typing import Dict, Any
@@ -42,6 +43,7 @@ def mock_response():
         response = MagicMock()
         response.status_code = status_code
         response.json.return_value = json_data or {}
+        response.content = json.dumps(json_data or {}).encode()
         response.text = text
         response.raise_for_status = MagicMock()
 
@@ -66,9 +68,14 @@ def mock_streaming_response():
             for chunk in chunks:
                 yield chunk
 
+        async def aiter_bytes():
+            for chunk in chunks:
+                yield chunk.encode("utf-8")
+
         response = MagicMock()
         response.status_code = status_code
         response.aiter_text = aiter_text
+        response.aiter_bytes = aiter_bytes
         response.raise_for_status = MagicMock()
 
         if status_code >= 400:
@@ -2,11 +2,17 @@
 Unit tests for LightRAG client functionality.
 """
 
+import asyncio
+import importlib.util
 import pytest
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
+import daniel_lightrag_mcp.client as client_module
+
 from daniel_lightrag_mcp.client import (
     LightRAGClient,
     LightRAGError,
@@ -23,7 +29,8 @@ from daniel_lightrag_mcp.models import (
     QueryResponse,
     QueryDataResponse,
     DocumentsResponse,
-    HealthResponse
+    HealthResponse,
+    QueryRequest
 )
 
 
@@ -58,6 +65,61 @@ class TestLightRAGClientInitialization:
         # Check that the API key is set in headers
         assert "X-API-Key" in client.client.headers
         assert client.client.headers["X-API-Key"] == "test_key"
+    
+    def test_client_requests_compressed_responses(self):
+        """Test client asks the server for compressed responses."""
+        client = LightRAGClient()
+        
+        assert "gzip" in client.client.headers["Accept-Encoding"]
+
+    def test_client_bounds_connect_timeout(self):
+        """Test the connect timeout is capped while reads keep the configured timeout."""
+        client = LightRAGClient(base_url="http://timeouts:9621", timeout=120.0)
+
+        assert client.client.timeout.read == 120.0
+        assert client.client.timeout.connect == 10.0
+
+    @pytest.mark.asyncio
+    async def test_clients_sharing_pool_share_request_gate(self):
+        """Test clients for the same server are bounded by one semaphore."""
+        first = LightRAGClient(base_url="http://gates:9621")
+        second = LightRAGClient(base_url="http://gates:9621")
+        other = LightRAGClient(base_url="http://other-gates:9621")
+
+        assert first.client is second.client
+        assert first._request_gate() is second._request_gate()
+        assert first._request_gate() is not other._request_gate()
+
+    def test_shared_pool_survives_new_event_loop(self):
+        """Test clients built in a later asyncio.run() get a pool for that loop."""
+        class HealthHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                body = json.dumps({"status": "healthy"}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), HealthHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        async def check_health():
+            client = LightRAGClient(base_url=base_url, http2=False)
+            return (await client.get_health()).status
+
+        try:
+            assert asyncio.run(check_health()) == "healthy"
+            assert asyncio.run(check_health()) == "healthy"
+        finally:
+            server.shutdown()
+            server.server_close()
 
 
 class TestErrorMapping:
@@ -107,6 +169,29 @@ class TestErrorMapping:
         
         assert isinstance(error, LightRAGValidationError)
         assert "Validation failed for field 'text'" in str(error)
+    
+    def test_map_http_error_prefers_parsed_body(self):
+        """Test error mapping uses the already-parsed body over the raw text."""
+        client = LightRAGClient()
+        error = client._map_http_error(404, "Not JSON", {"message": "Document missing"})
+        
+        assert isinstance(error, LightRAGAPIError)
+        assert "Document missing" in str(error)
+        assert error.response_data == {"message": "Document missing"}
+
+    def test_map_http_error_parses_body_lazily(self):
+        """Test the error body is only parsed once the message is read."""
+        client = LightRAGClient()
+        with patch.object(client_module, "_json_loads", wraps=json.loads) as loads:
+            error = client._map_http_error(429, '{"detail": "Slow down"}')
+
+            assert isinstance(error, LightRAGAPIError)
+            assert error.status_code == 429
+            loads.assert_not_called()
+
+            assert str(error) == "Rate Limited: HTTP 429: Slow down"
+            assert error.response_data == {"detail": "Slow down"}
+            loads.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -133,7 +218,7 @@ class TestDocumentManagementMethods:
         assert call_args[0][0] == "http://localhost:9621/documents/text"
 
         # Verify request data (file_source gets .txt extension)
-        request_data = call_args[1]["json"]
+        request_data = json.loads(call_args[1]["content"])
         assert request_data["text"] == "test content"
         assert request_data["file_source"] == "Test Title.txt"
     
@@ -169,6 +254,64 @@ class TestDocumentManagementMethods:
         assert isinstance(result, InsertResponse)
         lightrag_client.client.post.assert_called_once()
     
+    async def test_insert_texts_mixed_inputs(self, lightrag_client, mock_response, sample_insert_response):
+        """Test text insertion with a mix of documents, dicts and strings."""
+        lightrag_client.client.post = AsyncMock(return_value=mock_response(200, sample_insert_response))
+        
+        texts = [
+            TextDocument(content="Text 1"),
+            {"content": "Text 2"},
+            "Text 3"
+        ]
+        await lightrag_client.insert_texts(texts)
+        
+        request_data = json.loads(lightrag_client.client.post.call_args[1]["content"])
+        assert request_data["texts"] == ["Text 1", "Text 2", "Text 3"]
+        assert request_data["file_sources"] == ["text_input_1.txt", "text_input_2.txt", "text_input_3.txt"]
+
+    async def test_buffered_insert_coalesces_texts(self, lightrag_client, mock_response, sample_insert_response):
+        """Test buffered inserts are sent as one /documents/texts batch."""
+        lightrag_client.client.post = AsyncMock(return_value=mock_response(200, sample_insert_response))
+
+        async with lightrag_client.buffered_insert(max_batch=8) as bi:
+            futures = [
+                await bi.add("Text 1", "first"),
+                await bi.add("Text 2"),
+                await bi.add("Text 3")
+            ]
+
+        lightrag_client.client.post.assert_called_once()
+        assert lightrag_client.client.post.call_args[0][0].endswith("/documents/texts")
+        request_data = json.loads(lightrag_client.client.post.call_args[1]["content"])
+        assert request_data["texts"] == ["Text 1", "Text 2", "Text 3"]
+        assert request_data["file_sources"] == ["first.txt", "text_input_2.txt", "text_input_3.txt"]
+        results = await asyncio.gather(*futures)
+        assert all(isinstance(result, InsertResponse) for result in results)
+
+    async def test_buffered_insert_propagates_errors(self, lightrag_client, mock_response):
+        """Test a failed batch fails every future in it."""
+        lightrag_client.client.post = AsyncMock(return_value=mock_response(500, {"detail": "boom"}))
+
+        async with lightrag_client.buffered_insert() as bi:
+            future = await bi.add("Text 1")
+
+        with pytest.raises(LightRAGServerError):
+            await future
+
+    async def test_buffered_delete_coalesces_ids(self, lightrag_client, mock_response):
+        """Test buffered deletes are sent as one delete_document call."""
+        delete_response = {"status": "deletion_started", "message": "Deleting", "doc_id": "doc_1"}
+        lightrag_client.client.request = AsyncMock(return_value=mock_response(200, delete_response))
+
+        async with lightrag_client.buffered_delete(delete_file=True) as bd:
+            futures = [await bd.add("doc_1"), await bd.add("doc_2"), await bd.add("doc_1")]
+
+        lightrag_client.client.request.assert_called_once()
+        request_data = json.loads(lightrag_client.client.request.call_args[1]["content"])
+        assert request_data == {"doc_ids": ["doc_1", "doc_2"], "delete_file": True, "delete_llm_cache": False}
+        results = await asyncio.gather(*futures)
+        assert all(result.status == "deletion_started" for result in results)
+
     async def test_upload_document_success(self, lightrag_client, mock_response):
         """Test successful document upload."""
         # Setup mock - new API format
@@ -193,6 +336,23 @@ class TestDocumentManagementMethods:
             assert result.track_id == "track_upload"
             lightrag_client.client.post.assert_called_once()
     
+    async def test_upload_document_streams_multipart_body(self, lightrag_client, mock_response, tmp_path):
+        """Test document upload streams the file as a multipart body."""
+        upload_response = {"status": "uploaded", "message": "File uploaded successfully", "track_id": "track_upload"}
+        lightrag_client.client.post = AsyncMock(return_value=mock_response(200, upload_response))
+        file_path = tmp_path / "test.txt"
+        file_path.write_bytes(b"document contents")
+
+        await lightrag_client.upload_document(str(file_path))
+
+        call_args = lightrag_client.client.post.call_args
+        headers = call_args[1]["headers"]
+        body = b"".join([chunk async for chunk in call_args[1]["content"]])
+        assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert int(headers["Content-Length"]) == len(body)
+        assert b'name="file"; filename="test.txt"' in body
+        assert b"\r\n\r\ndocument contents\r\n" in body
+    
     async def test_upload_document_file_not_found(self, lightrag_client):
         """Test document upload with file not found."""
         with patch('os.path.exists', return_value=False):
@@ -213,7 +373,7 @@ class TestDocumentManagementMethods:
         assert result.status == "success"
         assert len(result.new_documents) == 2
         lightrag_client.client.post.assert_called_once_with(
-            "http://localhost:9621/documents/scan", json=None
+            "http://localhost:9621/documents/scan"
         )
 
     # Note: get_documents test is removed since the tool is deprecated in the API
@@ -243,7 +403,7 @@ class TestDocumentManagementMethods:
         # Setup mock - new API format
         delete_response = {"status": "success", "message": "Document deleted", "doc_id": "doc_123"}
         response = mock_response(200, delete_response)
-        lightrag_client.client.delete = AsyncMock(return_value=response)
+        lightrag_client.client.request = AsyncMock(return_value=response)
 
         # Execute
         result = await lightrag_client.delete_document("doc_123")
@@ -251,28 +411,38 @@ class TestDocumentManagementMethods:
         # Verify
         assert result.status == "success"
         assert result.doc_id == "doc_123"
-        lightrag_client.client.delete.assert_called_once()
+        lightrag_client.client.request.assert_called_once()
+
+    async def test_delete_document_single_id_body(self, lightrag_client, mock_response):
+        """Test the single-ID fast path encodes the same body as the general path."""
+        delete_response = {"status": "success", "message": "Document deleted", "doc_id": 'doc "1"'}
+        lightrag_client.client.request = AsyncMock(return_value=mock_response(200, delete_response))
+
+        await lightrag_client.delete_document('doc "1"')
+
+        request_data = json.loads(lightrag_client.client.request.call_args[1]["content"])
+        assert request_data == {"doc_ids": ['doc "1"'], "delete_file": False, "delete_llm_cache": False}
 
     async def test_delete_documents_batch_success(self, lightrag_client, mock_response):
         """Test successful batch document deletion."""
         # Setup mock - new API format
         delete_response = {"status": "success", "message": "Documents deleted", "track_id": "delete_batch"}
         response = mock_response(200, delete_response)
-        lightrag_client.client.delete = AsyncMock(return_value=response)
+        lightrag_client.client.request = AsyncMock(return_value=response)
 
         # Execute
         result = await lightrag_client.delete_document(["doc_1", "doc_2", "doc_3"])
 
         # Verify
         assert result.status == "success"
-        lightrag_client.client.delete.assert_called_once()
+        lightrag_client.client.request.assert_called_once()
 
     async def test_delete_document_with_options(self, lightrag_client, mock_response):
         """Test document deletion with file and cache deletion options."""
         # Setup mock - new API format
         delete_response = {"status": "success", "message": "Document deleted", "doc_id": "doc_123"}
         response = mock_response(200, delete_response)
-        lightrag_client.client.delete = AsyncMock(return_value=response)
+        lightrag_client.client.request = AsyncMock(return_value=response)
 
         # Execute
         result = await lightrag_client.delete_document(
@@ -284,7 +454,24 @@ class TestDocumentManagementMethods:
         # Verify
         assert result.status == "success"
         assert result.doc_id == "doc_123"
-        lightrag_client.client.delete.assert_called_once()
+        lightrag_client.client.request.assert_called_once()
+        call_args = lightrag_client.client.request.call_args
+        assert call_args[0] == ("DELETE", "http://localhost:9621/documents/delete_document")
+        assert json.loads(call_args[1]["content"]) == {
+            "doc_ids": ["doc_123"],
+            "delete_file": True,
+            "delete_llm_cache": True
+        }
+
+    @pytest.mark.parametrize("doc_ids", [None, [], "", [None]])
+    async def test_delete_document_invalid_ids(self, lightrag_client, doc_ids):
+        """Test invalid document IDs are rejected before any request is sent."""
+        lightrag_client.client.request = AsyncMock()
+
+        with pytest.raises(LightRAGValidationError):
+            await lightrag_client.delete_document(doc_ids)
+
+        lightrag_client.client.request.assert_not_called()
 
     async def test_clear_documents_success(self, lightrag_client, mock_response):
         """Test successful document clearing."""
@@ -330,10 +517,12 @@ class TestQueryMethods:
         assert call_args[0][0] == "http://localhost:9621/query"
 
         # Verify request data
-        request_data = call_args[1]["json"]
+        request_data = json.loads(call_args[1]["content"])
         assert request_data["query"] == "test query"
         assert request_data["mode"] == "mix"
         assert request_data["only_need_context"] is False
+        # Unset optional fields are not sent
+        assert "top_k" not in request_data
 
     async def test_query_text_with_bypass_mode(self, lightrag_client, mock_response):
         """Test query with bypass mode."""
@@ -359,6 +548,49 @@ class TestQueryMethods:
         with pytest.raises(LightRAGValidationError, match="Invalid query mode"):
             await lightrag_client.query_text("test query", mode="invalid_mode")
 
+    async def test_query_text_validation_error_top_k(self, lightrag_client):
+        """Test query with a non-positive top_k."""
+        with pytest.raises(LightRAGValidationError, match="top_k"):
+            await lightrag_client.query_text("test query", top_k=0)
+
+    async def test_query_text_payload_matches_query_request(self, lightrag_client, mock_response):
+        """Test the query payload matches the QueryRequest wire format."""
+        lightrag_client.client.post = AsyncMock(return_value=mock_response(200, {"response": "ok"}))
+        history = [{"role": "user", "content": "previous question"}]
+
+        await lightrag_client.query_text("test query", mode="local", top_k=5, conversation_history=history)
+
+        expected = QueryRequest(
+            query="test query",
+            mode="local",
+            top_k=5,
+            conversation_history=history,
+            stream=False
+        ).model_dump(mode="json", exclude_none=True)
+        assert json.loads(lightrag_client.client.post.call_args[1]["content"]) == expected
+
+    async def test_stream_request_decodes_split_characters(self, lightrag_client):
+        """Test streaming decodes multi-byte characters split across chunks."""
+        encoded = "héllo wörld".encode("utf-8")
+        split = encoded.index("é".encode("utf-8")) + 1
+
+        async def aiter_bytes():
+            yield encoded[:split]
+            yield encoded[split:]
+
+        streaming_response = MagicMock()
+        streaming_response.aiter_bytes = aiter_bytes
+        streaming_response.raise_for_status = MagicMock()
+        mock_stream_context = AsyncMock()
+        mock_stream_context.__aenter__ = AsyncMock(return_value=streaming_response)
+        mock_stream_context.__aexit__ = AsyncMock(return_value=None)
+        lightrag_client.client.stream = MagicMock(return_value=mock_stream_context)
+
+        results = [chunk async for chunk in lightrag_client.query_text_stream("test query")]
+
+        assert "".join(results) == "héllo wörld"
+        assert results[0] == "h"
+
     async def test_query_text_stream_success(self, lightrag_client, mock_streaming_response):
         """Test successful streaming text query."""
         # Setup mock
@@ -384,7 +616,7 @@ class TestQueryMethods:
         assert call_args[0][0] == "POST"
         assert call_args[0][1] == "http://localhost:9621/query/stream"
         # Verify essential params in request
-        request_json = call_args[1]["json"]
+        request_json = json.loads(call_args[1]["content"])
         assert request_json["query"] == "test query"
         assert request_json["mode"] == "mix"
         assert request_json["stream"] is True
@@ -419,11 +651,77 @@ class TestQueryMethods:
         lightrag_client.client.post.assert_called_once()
         call_args = lightrag_client.client.post.call_args
         assert call_args[0][0] == "http://localhost:9621/query/data"
-        request_json = call_args[1]["json"]
+        request_json = json.loads(call_args[1]["content"])
         assert request_json["query"] == "what are neural networks"
         assert request_json["mode"] == "local"
         assert request_json["stream"] is False
 
+    @pytest.mark.parametrize("has_ijson", [True, False])
+    async def test_query_data_iter(self, lightrag_client, sample_query_data_response, has_ijson):
+        """Test query_data_iter yields validated items section by section."""
+        body = json.dumps(sample_query_data_response).encode()
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, stream=httpx.ByteStream(body))
+
+        lightrag_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        ijson_module = client_module.ijson if has_ijson else None
+        with patch.object(client_module, "ijson", ijson_module):
+            items = [item async for item in lightrag_client.query_data_iter("what are neural networks", top_k=5)]
+
+        assert [section for section, _ in items] == ["entities", "relationships", "chunks", "references"]
+        assert items[0][1].entity_name == "Neural Networks"
+        assert items[1][1].weight == 0.85
+        request_json = json.loads(requests[0].content)
+        assert request_json["top_k"] == 5
+        assert request_json["include_references"] is True
+
+    async def test_get_documents_iter(self, lightrag_client):
+        """Test get_documents_iter yields (status, document) pairs."""
+        body = {"statuses": {
+            "processed": [{"id": "doc-1", "status": "processed"}, {"id": "doc-2", "status": "processed"}],
+            "failed": [{"id": "doc-3", "status": "failed", "metadata": {"tags": ["a"]}}]
+        }}
+        lightrag_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+        )
+
+        items = [item async for item in lightrag_client.get_documents_iter()]
+
+        assert [(status, doc["id"]) for status, doc in items] == [
+            ("processed", "doc-1"), ("processed", "doc-2"), ("failed", "doc-3")
+        ]
+        assert items[2][1]["metadata"] == {"tags": ["a"]}
+
+    async def test_get_documents_iter_http_error(self, lightrag_client):
+        """Test an error status on an unread stream is mapped to a LightRAG error."""
+        body = json.dumps({"detail": "Not here"}).encode()
+        lightrag_client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404, stream=httpx.ByteStream(body)))
+        )
+
+        with pytest.raises(LightRAGAPIError, match="Not here") as exc_info:
+            async for _ in lightrag_client.get_documents_iter():
+                pass
+
+        assert exc_info.value.status_code == 404
+
+    async def test_query_data_without_request_validation(self, lightrag_client, mock_response, sample_query_data_response):
+        """Test validate_requests=False encodes the body without QueryRequest."""
+        lightrag_client.validate_requests = False
+        lightrag_client.client.post = AsyncMock(return_value=mock_response(200, sample_query_data_response))
+
+        # A two-character query would fail QueryRequest's min_length check
+        await lightrag_client.query_data("ai", mode="local", top_k=5)
+
+        request_json = json.loads(lightrag_client.client.post.call_args[1]["content"])
+        assert request_json["query"] == "ai"
+        assert request_json["top_k"] == 5
+        assert "chunk_top_k" not in request_json
+        assert request_json["hl_keywords"] == []
+
     async def test_query_data_with_all_params(self, lightrag_client, mock_response, sample_query_data_response):
         """Test query_data with all parameters."""
         # Setup mock
@@ -451,7 +749,7 @@ class TestQueryMethods:
 
         # Verify request data
         call_args = lightrag_client.client.post.call_args
-        request_data = call_args[1]["json"]
+        request_data = json.loads(call_args[1]["content"])
         assert request_data["query"] == "test query"
         assert request_data["mode"] == "mix"
         assert request_data["top_k"] == 10
@@ -492,6 +790,27 @@ class TestKnowledgeGraphMethods:
             "http://localhost:9621/graphs", params={"label": "*"}
         )
     
+    async def test_get_knowledge_graph_with_limits(self, lightrag_client, mock_response, sample_graph_response):
+        """Test that depth/node limits are forwarded as query params."""
+        response = mock_response(200, sample_graph_response)
+        lightrag_client.client.get = AsyncMock(return_value=response)
+
+        await lightrag_client.get_knowledge_graph(label="Alice", max_depth=2, max_nodes=10)
+
+        lightrag_client.client.get.assert_called_once_with(
+            "http://localhost:9621/graphs",
+            params={"label": "Alice", "max_depth": 2, "max_nodes": 10}
+        )
+
+    async def test_get_knowledge_graph_raw(self, lightrag_client, mock_response, sample_graph_response):
+        """Test raw mode returns the parsed JSON without building a GraphResponse."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, sample_graph_response))
+
+        result = await lightrag_client.get_knowledge_graph(raw=True)
+
+        assert isinstance(result, dict)
+        assert result == sample_graph_response
+
     async def test_get_graph_labels_success(self, lightrag_client, mock_response):
         """Test successful graph labels retrieval."""
         # Setup mock
@@ -533,6 +852,42 @@ class TestKnowledgeGraphMethods:
             params={"name": "Test Entity"}
         )
 
+    async def test_graph_reads_cached_until_graph_write(self, lightrag_client, mock_response):
+        """Test label lists and entity checks are reused until the graph changes."""
+        exists_response = {"exists": True, "entity_name": "Test Entity", "entity_id": "ent_123"}
+        lightrag_client.client.get = AsyncMock(side_effect=lambda url, params=None: mock_response(
+            200, exists_response if "exists" in url else ["Entity A", "Entity B"]
+        ))
+        deletion_response = {"status": "success", "doc_id": "Test Entity", "message": "Entity deleted"}
+        lightrag_client.client.request = AsyncMock(return_value=mock_response(200, deletion_response))
+
+        await lightrag_client.get_graph_labels()
+        await lightrag_client.get_graph_labels()
+        await lightrag_client.check_entity_exists("Test Entity")
+        result = await lightrag_client.check_entity_exists("Test Entity")
+        assert result.exists is True
+        assert lightrag_client.client.get.call_count == 2
+
+        await lightrag_client.delete_entity("Test Entity")
+        await lightrag_client.get_graph_labels()
+        await lightrag_client.check_entity_exists("Test Entity")
+        assert lightrag_client.client.get.call_count == 4
+
+    async def test_get_cache_keyed_by_params_and_cleared_by_insert(self, lightrag_client, mock_response):
+        """Test cached GETs are keyed by params and dropped after an insert."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, ["Entity A"]))
+        insert_response = {"status": "success", "message": "Inserted", "track_id": "t1"}
+        lightrag_client.client.post = AsyncMock(return_value=mock_response(200, insert_response))
+
+        await lightrag_client.search_labels("entity", limit=10)
+        await lightrag_client.search_labels("entity", limit=10)
+        await lightrag_client.search_labels("entity", limit=20)
+        assert lightrag_client.client.get.call_count == 2
+
+        await lightrag_client.insert_text("New text content")
+        await lightrag_client.search_labels("entity", limit=10)
+        assert lightrag_client.client.get.call_count == 3
+
     async def test_update_entity_success(self, lightrag_client, mock_response):
         """Test successful entity update."""
         # Setup mock - new API format
@@ -550,7 +905,7 @@ class TestKnowledgeGraphMethods:
 
         # Verify request data
         call_args = lightrag_client.client.post.call_args
-        request_data = call_args[1]["json"]
+        request_data = json.loads(call_args[1]["content"])
         assert request_data["entity_name"] == "Test Entity"
         assert request_data["updated_data"] == updated_data
 
@@ -574,7 +929,7 @@ class TestKnowledgeGraphMethods:
         # Setup mock - new API format
         delete_response = {"status": "success", "doc_id": "ent_123", "message": "Entity deleted", "status_code": 200}
         response = mock_response(200, delete_response)
-        lightrag_client.client.delete = AsyncMock(return_value=response)
+        lightrag_client.client.request = AsyncMock(return_value=response)
 
         # Execute
         result = await lightrag_client.delete_entity("Test Entity")
@@ -582,14 +937,38 @@ class TestKnowledgeGraphMethods:
         # Verify
         assert result.status == "success"
         assert result.doc_id == "ent_123"
-        lightrag_client.client.delete.assert_called_once()
+        lightrag_client.client.request.assert_called_once()
+
+    async def test_graph_writes_without_request_validation(self, lightrag_client, mock_response):
+        """Test validate_requests=False encodes graph write bodies without request models."""
+        lightrag_client.validate_requests = False
+        create_response = {"status": "success", "message": "Entity created", "data": {"entity_name": "Test Entity"}}
+        lightrag_client.client.post = AsyncMock(return_value=mock_response(200, create_response))
+
+        with patch.object(client_module, "CreateEntityRequest") as request_model:
+            await lightrag_client.create_entity("Test Entity", {"entity_type": "person"})
+
+        request_model.assert_not_called()
+        request_json = json.loads(lightrag_client.client.post.call_args[1]["content"])
+        assert request_json == {"entity_name": "Test Entity", "entity_data": {"entity_type": "person"}}
+
+    async def test_delete_entity_request_body(self, lightrag_client, mock_response):
+        """Test delete_entity sends its one-field body without a request model."""
+        delete_response = {"status": "success", "doc_id": "ent_123", "message": "Entity deleted", "status_code": 200}
+        lightrag_client.client.request = AsyncMock(return_value=mock_response(200, delete_response))
+
+        await lightrag_client.delete_entity("Test Entity")
+
+        assert not hasattr(client_module, "DeleteEntityRequest")
+        request_json = json.loads(lightrag_client.client.request.call_args[1]["content"])
+        assert request_json == {"entity_name": "Test Entity"}
 
     async def test_delete_relation_success(self, lightrag_client, mock_response):
         """Test successful relation deletion."""
         # Setup mock - new API format
         delete_response = {"status": "success", "doc_id": "rel_123", "message": "Relation deleted", "status_code": 200}
         response = mock_response(200, delete_response)
-        lightrag_client.client.delete = AsyncMock(return_value=response)
+        lightrag_client.client.request = AsyncMock(return_value=response)
 
         # Execute
         result = await lightrag_client.delete_relation("Entity A", "Entity B")
@@ -597,7 +976,7 @@ class TestKnowledgeGraphMethods:
         # Verify
         assert result.status == "success"
         assert result.doc_id == "rel_123"
-        lightrag_client.client.delete.assert_called_once()
+        lightrag_client.client.request.assert_called_once()
 
     async def test_get_popular_labels_success(self, lightrag_client, mock_response, sample_popular_labels_response):
         """Test successful popular labels retrieval."""
@@ -740,6 +1119,61 @@ class TestSystemManagementMethods:
             "http://localhost:9621/documents/track_status/track_123", params=None
         )
 
+    async def test_get_track_statuses_success(self, lightrag_client, mock_response):
+        """Test concurrent track status retrieval keeps order and surfaces errors."""
+        def respond(url, params=None):
+            track_id = url.rsplit("/", 1)[-1]
+            if track_id == "missing":
+                return mock_response(404, text='{"detail": "Track not found"}')
+            return mock_response(200, {"track_id": track_id, "documents": [], "total_count": 0})
+        lightrag_client.client.get = AsyncMock(side_effect=respond)
+
+        results = await lightrag_client.get_track_statuses(["track_1", "missing", "track_2"])
+
+        assert results[0].track_id == "track_1"
+        assert isinstance(results[1], LightRAGAPIError)
+        assert results[2].track_id == "track_2"
+        assert lightrag_client.client.get.call_count == 3
+
+    async def test_concurrent_status_reads_share_one_request(self, lightrag_client, mock_response):
+        """Test concurrent identical status reads are coalesced into one request."""
+        release = asyncio.Event()
+
+        async def slow_get(url, params=None):
+            await release.wait()
+            return mock_response(200, {"track_id": "track_123", "documents": [], "total_count": 0})
+        lightrag_client.client.get = AsyncMock(side_effect=slow_get)
+
+        pending = asyncio.gather(*(lightrag_client.get_track_status("track_123") for _ in range(3)))
+        await asyncio.sleep(0)
+        release.set()
+        results = await pending
+
+        assert [r.track_id for r in results] == ["track_123"] * 3
+        assert lightrag_client.client.get.call_count == 1
+        assert lightrag_client._inflight == {}
+
+        # Once finished, the next read goes to the server again
+        await lightrag_client.get_track_status("track_123")
+        assert lightrag_client.client.get.call_count == 2
+
+    async def test_concurrent_cached_reads_share_one_request(self, lightrag_client, mock_response):
+        """Test concurrent cache misses for the same graph read are coalesced."""
+        release = asyncio.Event()
+
+        async def slow_get(url, params=None):
+            await release.wait()
+            return mock_response(200, ["Entity A"])
+        lightrag_client.client.get = AsyncMock(side_effect=slow_get)
+
+        pending = asyncio.gather(*(lightrag_client.get_graph_labels(raw=True) for _ in range(3)))
+        await asyncio.sleep(0)
+        release.set()
+        results = await pending
+
+        assert results == [{"labels": ["Entity A"]}] * 3
+        assert lightrag_client.client.get.call_count == 1
+
     async def test_get_document_status_counts_success(self, lightrag_client, mock_response, sample_status_counts_response):
         """Test successful document status counts retrieval."""
         # Setup mock - new API format returns status_counts object
@@ -791,7 +1225,7 @@ class TestSystemManagementMethods:
 
         # Verify request data
         call_args = lightrag_client.client.post.call_args
-        request_data = call_args[1]["json"]
+        request_data = json.loads(call_args[1]["content"])
         assert request_data["cache_type"] == "query"
     
     async def test_get_health_success(self, lightrag_client, mock_response, sample_health_response):
@@ -813,6 +1247,54 @@ class TestSystemManagementMethods:
             "http://localhost:9621/health", params=None
         )
 
+    async def test_status_reads_cached_until_invalidated(self, lightrag_client, mock_response, sample_health_response):
+        """Test repeated health checks reuse the response until caches are invalidated."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, sample_health_response))
+
+        await lightrag_client.get_health()
+        await lightrag_client.get_health()
+        assert lightrag_client.client.get.call_count == 1
+
+        lightrag_client.invalidate_caches()
+        await lightrag_client.get_health()
+        assert lightrag_client.client.get.call_count == 2
+
+    async def test_read_overlapping_write_not_cached(self, lightrag_client, mock_response):
+        """Test a read that started before an invalidation does not store its response."""
+        async def get_during_write(*args, **kwargs):
+            lightrag_client.invalidate_caches()
+            return mock_response(200, ["Entity A"])
+
+        lightrag_client.client.get = AsyncMock(side_effect=get_during_write)
+
+        await lightrag_client.get_graph_labels()
+        await lightrag_client.get_graph_labels()
+        assert lightrag_client.client.get.call_count == 2
+
+    async def test_get_documents_uses_short_status_ttl(self, lightrag_client, mock_response, monkeypatch):
+        """Test document listings expire with the short status TTL, not the GET cache TTL."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"statuses": {}}))
+        now = [1000.0]
+        monkeypatch.setattr("daniel_lightrag_mcp.client.time.monotonic", lambda: now[0])
+
+        await lightrag_client.get_documents(raw=True)
+        await lightrag_client.get_documents(raw=True)
+        assert lightrag_client.client.get.call_count == 1
+
+        now[0] += 5.0
+        await lightrag_client.get_documents(raw=True)
+        assert lightrag_client.client.get.call_count == 2
+
+    async def test_cache_ttl_zero_disables_caching(self, mock_httpx_client, mock_response):
+        """Test cache_ttl=0 sends every read upstream."""
+        client = LightRAGClient(base_url="http://localhost:9621", cache_ttl=0)
+        client.client = mock_httpx_client
+        client.client.get = AsyncMock(return_value=mock_response(200, ["Entity A"]))
+
+        await client.get_graph_labels(raw=True)
+        await client.get_graph_labels(raw=True)
+        assert client.client.get.call_count == 2
+
 
 @pytest.mark.asyncio
 class TestErrorHandling:
@@ -850,13 +1332,22 @@ class TestErrorHandling:
         with pytest.raises(LightRAGTimeoutError, match="Request timeout"):
             await lightrag_client.get_health()
     
+    async def test_timeout_subclass_error_handling(self, lightrag_client):
+        """Test httpx timeout subclasses map to the timeout error, not connection error."""
+        lightrag_client.client.get = AsyncMock(
+            side_effect=httpx.ConnectTimeout("Connect timed out")
+        )
+        
+        with pytest.raises(LightRAGTimeoutError, match="Request timeout for GET"):
+            await lightrag_client.get_health()
+    
     async def test_json_decode_error_handling(self, lightrag_client):
         """Test handling of JSON decode errors."""
         # Setup mock with invalid JSON response
         response = MagicMock()
         response.status_code = 200
         response.raise_for_status = MagicMock()
-        response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+        response.content = b"Invalid JSON response"
         response.text = "Invalid JSON response"
         response.headers = {}  # Add proper headers mock
         
@@ -865,7 +1356,43 @@ class TestErrorHandling:
         # Execute and verify error (it will be wrapped in LightRAGError due to exception handling)
         with pytest.raises(LightRAGError, match="Invalid JSON response"):
             await lightrag_client.get_health()
-    
+
+    async def test_debug_logging_of_request_and_response(self, lightrag_client, mock_response, caplog):
+        """Test request bodies and response headers are logged at debug level."""
+        response = mock_response(200, {"status": "success", "message": "ok"})
+        response.headers = httpx.Headers({"content-type": "application/json"})
+        lightrag_client.client.post = AsyncMock(return_value=response)
+
+        with caplog.at_level("DEBUG", logger="daniel_lightrag_mcp.client"):
+            await lightrag_client.insert_text("test content")
+
+        assert '"text": "test content"' in caplog.text
+        assert "content-type" in caplog.text
+
+    async def test_make_request_method_dispatch(self, lightrag_client, mock_response):
+        """Test lower-case verbs are accepted and unknown verbs rejected."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"status": "healthy"}))
+
+        assert await lightrag_client._make_request("get", "/health") == {"status": "healthy"}
+        lightrag_client.client.get.assert_called_once()
+
+        with pytest.raises(LightRAGError, match="Unsupported HTTP method: PATCH"):
+            await lightrag_client._make_request("PATCH", "/health")
+
+    async def test_typed_json_decode_error_handling(self, lightrag_client):
+        """Test invalid JSON on a model-validated response maps to an API error."""
+        response = MagicMock()
+        response.status_code = 200
+        response.raise_for_status = MagicMock()
+        response.content = b"Invalid JSON response"
+        response.text = "Invalid JSON response"
+        response.headers = {}
+
+        lightrag_client.client.post = AsyncMock(return_value=response)
+
+        with pytest.raises(LightRAGAPIError, match="Invalid JSON response"):
+            await lightrag_client.query_text("test query")
+
     async def test_streaming_error_handling(self, lightrag_client):
         """Test error handling in streaming requests."""
         # Setup mock to raise HTTP error in streaming
@@ -884,6 +1411,23 @@ class TestErrorHandling:
             async for _ in lightrag_client.query_text_stream("test query"):
                 pass
 
+    async def test_unexpected_error_translation(self, lightrag_client):
+        """Test unexpected errors are wrapped with the method's failure prefix."""
+        lightrag_client._make_request = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(LightRAGError, match="Query operation failed: boom") as exc_info:
+            await lightrag_client.query_text("test query")
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+        async def failing_stream(*args, **kwargs):
+            raise RuntimeError("boom")
+            yield  # pragma: no cover
+
+        lightrag_client._stream_request = failing_stream
+        with pytest.raises(LightRAGError, match="Streaming query operation failed: boom"):
+            async for _ in lightrag_client.query_text_stream("test query"):
+                pass
+
 
 @pytest.mark.asyncio
 class TestContextManager:
@@ -899,7 +1443,7 @@ class TestContextManager:
     
     async def test_manual_close(self):
         """Test manual client closing."""
-        client = LightRAGClient()
+        client = LightRAGClient(base_url="http://manual-close:9621")
         
         # Mock the httpx client close method
         client.client.aclose = AsyncMock()
@@ -908,4 +1452,96 @@ class TestContextManager:
         await client.__aexit__(None, None, None)
         
         # Verify close was called
-        client.client.aclose.assert_called_once()
\ No newline at end of file
+        client.client.aclose.assert_called_once()
+    
+    async def test_shared_client_closed_by_last_user(self):
+        """Test the shared httpx client stays open until its last user exits."""
+        first = LightRAGClient(base_url="http://refcount:9621")
+        second = LightRAGClient(base_url="http://refcount:9621")
+        first.client.aclose = AsyncMock()
+        
+        async with first:
+            pass
+        await first.aclose()
+        first.client.aclose.assert_not_called()
+        
+        async with second:
+            pass
+        first.client.aclose.assert_called_once()
+        assert LightRAGClient(base_url="http://refcount:9621").client is not first.client
+    
+    async def test_clients_share_http_client(self):
+        """Test clients for the same server share one httpx client."""
+        first = LightRAGClient(base_url="http://shared:9621", api_key="key")
+        second = LightRAGClient(base_url="http://shared:9621/", api_key="key")
+        other = LightRAGClient(base_url="http://shared:9621", api_key="other")
+        
+        assert first.client is second.client
+        assert first.client is not other.client
+        
+        await LightRAGClient.aclose_all()
+        
+        assert first.client.is_closed
+        assert other.client.is_closed
+        assert LightRAGClient(base_url="http://shared:9621", api_key="key").client is not first.client
+    
+    async def test_http2_opt_out_uses_separate_client(self):
+        """Test http2=False gets its own pooled client."""
+        default = LightRAGClient(base_url="http://h1only:9621")
+        http1_only = LightRAGClient(base_url="http://h1only:9621", http2=False)
+        
+        assert http1_only.client is LightRAGClient(base_url="http://h1only:9621", http2=False).client
+        if importlib.util.find_spec("h2") is not None:
+            assert default.client is not http1_only.client
+        
+        await LightRAGClient.aclose_all()
+
+
+
+@pytest.mark.asyncio
+class TestExecuteTool:
+    """Test tool dispatch through execute_tool."""
+    
+    async def test_execute_tool_dispatch(self, lightrag_client, mock_response):
+        """Test tools are routed to their client methods with their arguments."""
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, {"exists": True}))
+        
+        result = await lightrag_client.execute_tool("check_entity_exists", {"entity_name": "Alice"})
+        
+        assert result.exists is True
+        assert lightrag_client.client.get.call_args[1]["params"] == {"name": "Alice"}
+    
+    async def test_execute_tool_query_data_arguments(self, lightrag_client):
+        """Test the query_data tool forwards the arguments query_data accepts."""
+        lightrag_client.query_data = AsyncMock(return_value="ok")
+        
+        assert await lightrag_client.execute_tool("query_data", {"query": "test query", "top_k": 5}) == "ok"
+        kwargs = lightrag_client.query_data.call_args[1]
+        assert kwargs["query"] == "test query"
+        assert kwargs["top_k"] == 5
+        assert kwargs["mode"] == "mix"
+    
+    async def test_execute_tool_unknown(self, lightrag_client):
+        """Test unknown tool names are rejected."""
+        with pytest.raises(ValueError, match="Unknown tool: nope"):
+            await lightrag_client.execute_tool("nope", {})
+
+    async def test_execute_tool_raw_passthrough(self, lightrag_client, mock_response):
+        """Test raw=True returns the parsed graph without building a model."""
+        graph = {"nodes": [{"id": "A"}], "edges": [], "is_truncated": False}
+        lightrag_client.client.get = AsyncMock(return_value=mock_response(200, graph))
+        
+        result = await lightrag_client.execute_tool("get_knowledge_graph", {"label": "A", "raw": True})
+        
+        assert result == graph
+
+    async def test_execute_tool_delete_single_document(self, lightrag_client, mock_response):
+        """Test a single document_id reaches delete_document's fast path."""
+        delete_response = {"status": "success", "message": "Document deleted", "doc_id": "doc_1"}
+        lightrag_client.client.request = AsyncMock(return_value=mock_response(200, delete_response))
+        
+        await lightrag_client.execute_tool("delete_document", {"document_id": "doc_1"})
+        
+        content = lightrag_client.client.request.call_args[1]["content"]
+        assert content.endswith(client_module._DELETE_ONE_DOC_TAIL)
+        assert json.loads(content) == {"doc_ids": ["doc_1"], "delete_file": False, "delete_llm_cache": False}
@@ -333,6 +333,21 @@ class TestClientInitialization:
         assert "prefix2" in clients
         assert mock_client_class.call_count == 2
 
+    @pytest.mark.asyncio
+    @patch.dict("os.environ", {"LIGHTRAG_HTTP_PREFIXES": "a:http://localhost:9621:key1,b:http://localhost:9621:key1,c:http://localhost:9621:key2"})
+    @patch("daniel_lightrag_mcp.http_server.LightRAGClient")
+    async def test_initialize_shares_client_for_same_server(self, mock_client_class):
+        """Test prefixes with the same URL and key share one client."""
+        from daniel_lightrag_mcp.http_server import initialize_clients
+
+        mock_client_class.side_effect = lambda **kwargs: MagicMock()
+        clients.clear()
+        await initialize_clients()
+
+        assert clients["a"] is clients["b"]
+        assert clients["a"] is not clients["c"]
+        assert mock_client_class.call_count == 2
+
     @pytest.mark.asyncio
     @patch.dict("os.environ", {}, clear=True)
     @patch("daniel_lightrag_mcp.http_server.LightRAGClient")
@@ -347,6 +362,18 @@ class TestClientInitialization:
         assert "default" in clients
         assert mock_client_class.call_count == 1
 
+    def test_parse_prefix_entry(self):
+        """Test parsing of LIGHTRAG_HTTP_PREFIXES entries."""
+        from daniel_lightrag_mcp.http_server import _parse_prefix_entry
+
+        assert _parse_prefix_entry("a:http://localhost:9621:key1") == ("a", "http://localhost:9621", "key1")
+        assert _parse_prefix_entry("a:https://example.com:443") == ("a", "https://example.com:443", "")
+        assert _parse_prefix_entry("a:https://example.com") == ("a", "https://example.com", "")
+        assert _parse_prefix_entry("a:localhost:key1") == ("a", "localhost", "key1")
+        assert _parse_prefix_entry("a:localhost") == ("a", "localhost", "")
+        assert _parse_prefix_entry("a") is None
+        assert _parse_prefix_entry(":http://localhost:9621") is None
+
 
 class TestResponseFormats:
     """Tests for response formats."""
@@ -365,6 +392,23 @@ class TestResponseFormats:
         assert "success" in data
         assert "data" in data or "error" in data
 
+    def test_regular_response_plain_data(self, test_client, mock_lightrag_client):
+        """Test plain JSON tool results are returned unchanged."""
+        graph = {"nodes": [{"id": "A", "properties": {"weight": 1.5}}], "edges": []}
+        mock_lightrag_client.execute_tool.return_value = graph
+
+        response = test_client.post(
+            "/mcp/test_prefix/test_prefix_get_knowledge_graph",
+            json={"arguments": {}}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"success": True, "data": graph, "error": None}
+        mock_lightrag_client.execute_tool.assert_called_once_with(
+            "get_knowledge_graph", {"raw": True}
+        )
+
     @pytest.mark.asyncio
     async def test_streaming_response_format(self, mock_lightrag_client):
         """Test NDJSON streaming response format."""
@@ -407,5 +451,39 @@ class TestResponseFormats:
                     assert "type" in data
 
 
+def test_example_client_insert_invalidates_query_cache(monkeypatch):
+    """Inserting through the example client drops cached query answers."""
+    import importlib.util
+    from pathlib import Path
+
+    path = Path(__file__).resolve().parent.parent / "examples" / "http_client_python.py"
+    spec = importlib.util.spec_from_file_location("http_client_python", path)
+    example = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(example)
+
+    calls = []
+
+    def fake_execute_tool(self, tool_name, arguments):
+        calls.append(tool_name)
+        if tool_name == "query_text":
+            return {"data": {"response": f"answer {len(calls)}"}}
+        return {"data": {"track_id": "t"}}
+
+    monkeypatch.setattr(example.LightRAGHTTPClient, "execute_tool", fake_execute_tool)
+
+    with example.LightRAGHTTPClient(prefix="test") as http_client:
+        first = http_client.query_text("q")
+        assert http_client.query_text("q") == first
+
+        http_client.insert_text("new content")
+        assert http_client.query_text("q") != first
+
+        second = http_client.query_text("q")
+        http_client.insert_texts_batched(["a", "b"], batch_size=1)
+        assert http_client.query_text("q") != second
+
+    assert calls.count("query_text") == 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
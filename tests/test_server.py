@@ -319,7 +319,7 @@ class TestDocumentManagementTools:
         # Verify
         assert not result.isError
         mock_client.delete_document.assert_called_once_with(
-            doc_ids=["doc_123"],
+            doc_ids="doc_123",
             delete_file=False,
             delete_llm_cache=False
         )
@@ -381,7 +381,7 @@ class TestDocumentManagementTools:
         # Verify
         assert not result.isError
         mock_client.delete_document.assert_called_once_with(
-            doc_ids=["doc_123"],
+            doc_ids="doc_123",
             delete_file=True,
             delete_llm_cache=True
         )